@@ -9,68 +9,154 @@ import numpy as np
 
 MAGIC = 0xDEADBEEF
 
-def bin_to_csv(bin_filename, create_df: bool):
+# Version 1: vehicle logs, <I timestamp_ms, <B id, <f value per entry (9 bytes, matches C++)
+# Version 2: base station row logs (Loggers.BinaryLogger), <d timestamp (s)
+#            then one <f per signal in header order, NaN = no value
+# Version 3: base station event logs (Loggers.EventLogger), header padded to
+#            EVENT_HEADER_SIZE, then <d timestamp (s), <B id, <f value on change.
+#            id KEYFRAME_ID starts a keyframe: value = number of events that
+#            follow and repeat the current state of every signal.
+ENTRY_DTYPE = np.dtype([("timestamp_ms", "<u4"), ("id", "u1"), ("value", "<f4")])
+EVENT_DTYPE = np.dtype([("timestamp", "<f8"), ("id", "u1"), ("value", "<f4")])
+EVENT_HEADER_SIZE = 16384
+KEYFRAME_ID = 0xFF
+
+
+def read_header(bin_file):
+    """Returns (version, {id: name}, data offset) and leaves bin_file at the data."""
+    magic = struct.unpack('<I', bin_file.read(4))[0]
+    if magic != MAGIC:
+        raise ValueError(f"Bad magic: {hex(magic)}")
+
+    version = struct.unpack('<B', bin_file.read(1))[0]
+    num_signals = struct.unpack('<B', bin_file.read(1))[0]
+
+    signals = {}
+    for _ in range(num_signals):
+        sid = struct.unpack('<B', bin_file.read(1))[0]
+        name_len = struct.unpack('<B', bin_file.read(1))[0]
+        name = bin_file.read(name_len).decode('utf-8', errors='ignore')
+        signals[sid] = name
+
+    if version == 3:
+        bin_file.seek(EVENT_HEADER_SIZE)
+    return version, signals, bin_file.tell()
+
+
+def keyframe_mask(records):
+    """True for keyframe markers and the state events that follow them."""
+    n = len(records)
+    markers = np.flatnonzero(records["id"] == KEYFRAME_ID)
+    ends = np.minimum(markers + records["value"][markers].astype(np.int64) + 1, n)
+    delta = np.zeros(n + 1, dtype=np.int64)
+    np.add.at(delta, markers, 1)
+    np.add.at(delta, ends, -1)
+    return np.cumsum(delta[:n]) > 0
+
+
+def read_bin(bin_filename, keyframes=False):
+    """
+    Read a .bin log into a long DataFrame (timestamp_ms, id, signal, value)
+    with NumPy, whatever the record version. Returns (version, signals, df).
+    keyframes: keep the repeated state events of version 3 keyframes.
+    """
     with open(bin_filename, 'rb') as bin_file:
+        version, signals, _ = read_header(bin_file)
+        payload = bin_file.read()
+
+    # -------------------------
+    # DATA
+    # -------------------------
+    if version == 2:
+        ids = np.array(list(signals.keys()), dtype=np.uint8)
+        dtype = np.dtype([("timestamp", "<f8"), ("values", "<f4", (len(ids),))])
+    elif version == 3:
+        dtype = EVENT_DTYPE
+    else:
+        dtype = ENTRY_DTYPE
+
+    # A log cut off mid-write can end in a partial record
+    usable = len(payload) - len(payload) % dtype.itemsize
+    records = np.frombuffer(payload[:usable], dtype=dtype)
+
+    print(f"Version: {version}")
+    print(f"Signals: {signals}")
+    print(f"Entry size: {dtype.itemsize} bytes")
+
+    if version == 2:
+        values = records["values"]
+        timestamps = np.round(records["timestamp"] * 1000).astype(np.int64)
+        df = pd.DataFrame({
+            "timestamp_ms": np.repeat(timestamps, len(ids)),
+            "id": np.tile(ids, len(records)),
+            "value": values.ravel(),
+        })
+        df = df[df["value"].notna()]
+    elif version == 3:
+        if keyframes:
+            records = records[records["id"] != KEYFRAME_ID]
+        else:
+            records = records[~keyframe_mask(records)]
+        df = pd.DataFrame({
+            "timestamp_ms": np.round(records["timestamp"] * 1000).astype(np.int64),
+            "id": records["id"],
+            "value": records["value"],
+        })
+    else:
+        df = pd.DataFrame({
+            "timestamp_ms": records["timestamp_ms"].astype(np.int64),
+            "id": records["id"],
+            "value": records["value"],
+        })
 
-        # -------------------------
-        # HEADER
-        # -------------------------
-        magic = struct.unpack('<I', bin_file.read(4))[0]
-        if magic != MAGIC:
-            raise ValueError(f"Bad magic: {hex(magic)}")
-
-        version = struct.unpack('<B', bin_file.read(1))[0]
-        num_signals = struct.unpack('<B', bin_file.read(1))[0]
-
-        signals = {}
-        rows = []
-
-        for _ in range(num_signals):
-            sid = struct.unpack('<B', bin_file.read(1))[0]
-            name_len = struct.unpack('<B', bin_file.read(1))[0]
-            name = bin_file.read(name_len).decode('utf-8', errors='ignore')
-            signals[sid] = name
-
-        print(f"Version: {version}")
-        print(f"Signals: {signals}")
-
-        # -------------------------
-        # DATA FORMAT (MATCHES C++)
-        # -------------------------
-        entry_format = '<I B f'   # 4 + 1 + 4 = 9 bytes
-        entry_size = struct.calcsize(entry_format)
-
-        print(f"Entry size: {entry_size} bytes")  # should print 9
-
-        csv_filename = bin_filename.replace('.bin', '.csv')
+    names = df["id"].map(signals)
+    df.insert(2, "signal", names.fillna("UNKNOWN_" + df["id"].astype(str)))
+    return version, signals, df.reset_index(drop=True)
 
-        with open(csv_filename, 'w', newline='') as csv_file:
-            writer = csv.writer(csv_file)
-            writer.writerow(['timestamp_ms', 'id', 'signal', 'value'])
 
-            # -------------------------
-            # READ DATA
-            # -------------------------
-            while True:
-                chunk = bin_file.read(entry_size)
-                if len(chunk) < entry_size:
-                    break
+def state_at(bin_filename, t):
+    """
+    Value of every signal at wall-clock time t (s) in a version 3 event log:
+    binary search for t, back to the nearest keyframe, replay from there.
+    Only the pages around t are read.
+    """
+    with open(bin_filename, 'rb') as bin_file:
+        version, signals, offset = read_header(bin_file)
+    if version != 3:
+        raise ValueError(f"state_at needs an event log (version 3), got version {version}")
+
+    n = (os.path.getsize(bin_filename) - offset) // EVENT_DTYPE.itemsize
+    if n == 0:
+        return {}
+    records = np.memmap(bin_filename, dtype=EVENT_DTYPE, mode="r", offset=offset, shape=(n,))
+
+    end = int(np.searchsorted(records["timestamp"], t, side="right"))
+    start = end
+    while start > 0:
+        lo = max(start - 4096, 0)
+        markers = np.flatnonzero(records["id"][lo:start] == KEYFRAME_ID)
+        if len(markers):
+            start = lo + int(markers[-1])
+            break
+        start = lo
+
+    state = {}
+    chunk = records[start:end]
+    for sid, value in zip(chunk["id"].tolist(), chunk["value"].tolist()):
+        if sid != KEYFRAME_ID:
+            state[signals.get(sid, f"UNKNOWN_{sid}")] = value
+    return state
 
-                timestamp, sensor_id, value = struct.unpack(entry_format, chunk)
-                name = signals.get(sensor_id, "UNKNOWN")
 
-                writer.writerow([timestamp, sensor_id, name, f"{value:.4f}"])
+def bin_to_csv(bin_filename, create_df: bool):
+    version, signals, df = read_bin(bin_filename)
 
-                if create_df:
-                    rows.append({
-                        "timestamp_ms": timestamp,
-                        "signal": signals.get(sensor_id, f"UNKNOWN_{sensor_id}"),
-                        "value": value
-                    })
+    csv_filename = bin_filename.replace('.bin', '.csv')
+    df.to_csv(csv_filename, index=False, float_format="%.4f")
 
     print(f"Done: {csv_filename}")
     if create_df:
-        return pd.DataFrame(rows)
+        return df[["timestamp_ms", "signal", "value"]]
     
 def load_csv(file_path: str) -> pd.DataFrame:
     """
@@ -0,0 +1,277 @@
+from functools import lru_cache
+
+from PIL import Image, ImageDraw, ImageFont, ImageTk
+
+from GUI_Widgets import *
+
+# ==============================
+# Compositing renderer
+# ==============================
+# Optional alternative to one Tk frame + canvas per widget: a whole layout
+# panel is drawn into one PIL image and shown through a single PhotoImage.
+# Cells report whether anything visible changed; only those are redrawn and
+# only their rectangles are copied into the PhotoImage.
+#
+# Enable with "renderer": "composite" at the top of a layout file (or on a
+# single frame). Frames that only contain the cell types below become one
+# CompositePanel, anything else is built as normal Tk widgets.
+
+
+@lru_cache(maxsize=64)
+def _font(size):
+    # Found by name on the font path, no Matplotlib import for a font
+    try:
+        return ImageFont.truetype("DejaVuSans-Bold.ttf", size)
+    except OSError:
+        pass
+    try:
+        return ImageFont.load_default(size)  # scalable since Pillow 10.1
+    except TypeError:
+        return ImageFont.load_default()
+
+
+class Cell:
+    """One widget drawn into a CompositePanel. rect is (x0, y0, x1, y1) in panel pixels."""
+
+    def __init__(self, title="", col_name=None, layout=None):
+        self.title = title
+        self.col_names = [col_name]
+        self.layout = layout or {}
+        self.rect = None
+        self.state = None
+
+    def update_data(self, data) -> bool:
+        """Take new data, return True if the cell has to be redrawn."""
+        state = self.visual_state(data)
+        if state is None or state == self.state:
+            return False
+        self.state = state
+        return True
+
+    def visual_state(self, data):
+        return None
+
+    def render(self, draw, bg):
+        pass
+
+
+class InfoCell(Cell):
+    """InfoBox look (rounded box, age border, threshold colours) without a Tk canvas."""
+
+    def __init__(self, title="", col_name="", precision=2, bg_color="grey", fg_color="white",
+                 corner_radius=35, padding=5, warn_min=None, warn_max=None, crit_min=None, crit_max=None,
+                 layout=None, **kwargs):
+        super().__init__(title, col_name, layout)
+        self.precision = precision
+        self.bg_color = bg_color
+        self.fg_color = fg_color
+        self.corner_radius = corner_radius
+        self.padding = padding
+        self.warn_min = warn_min
+        self.warn_max = warn_max
+        self.crit_min = crit_min
+        self.crit_max = crit_max
+        self.value = "--"
+        self.age = None
+        self.max_chars = len(self.value)
+
+    # Same colour rules as InfoBox
+    _get_bg_color = InfoBox._get_bg_color
+    _get_border_color = InfoBox._get_border_color
+
+    def visual_state(self, data):
+        value = data.get(self.col_names[0])
+        if value:
+            self.age = data.age(self.col_names[0])
+            try:
+                self.value = f"{value:.{self.precision}f}"
+            except Exception:
+                self.value = str(value)
+            self.max_chars = max(self.max_chars, len(self.value))
+        return self.value, self._get_bg_color(), self._get_border_color()
+
+    def render(self, draw, bg):
+        x0, y0, x1, y1 = self.rect
+        w, h = x1 - x0, y1 - y0
+        text, fill, border = self.state or (self.value, self._get_bg_color(), self._get_border_color())
+
+        border_width = 4
+        r = max(min(self.corner_radius, w // 4, h // 4), 1)
+        draw.rectangle(self.rect, fill=bg)
+        draw.rounded_rectangle(self.rect, r, fill=border)
+        draw.rounded_rectangle((x0 + border_width, y0 + border_width, x1 - border_width, y1 - border_width),
+                               max(r - border_width, 1), fill=fill)
+
+        # Same sizing as InfoBox._draw_text
+        title_size = max(min(int(h * 0.12), int(w / (max(len(self.title), 1) * 0.9))), 12)
+        value_size = max(min(int(h * 0.35), int(w / (self.max_chars * 0.9))), 16)
+
+        draw.text((x0 + self.padding, y0 + self.padding), self.title, fill=self.fg_color, font=_font(title_size))
+        draw.text((x0 + w / 2, y0 + h / 2), text, fill=self.fg_color, font=_font(value_size), anchor="mm")
+
+
+class BarCell(Cell):
+    """VerticalBar look."""
+
+    def __init__(self, title="", col_name=None, max_value=100, bar_color="green", layout=None, **kwargs):
+        super().__init__(title, col_name, layout)
+        self.max_value = max_value
+        self.bar_color = bar_color
+        self.current_value = 0
+
+    def _bar_box(self):
+        x0, y0, x1, y1 = self.rect
+        return x0, y0 + 18, x1, y1
+
+    def visual_state(self, data):
+        value = data.get(self.col_names[0])
+        if value:
+            self.current_value = value
+        if self.rect is None:
+            return None
+        _, by0, _, by1 = self._bar_box()
+        value = max(0, min(self.current_value, self.max_value))
+        return int(value / self.max_value * (by1 - by0))  # bar height in pixels
+
+    def render(self, draw, bg):
+        x0, y0, x1, y1 = self.rect
+        bx0, by0, bx1, by1 = self._bar_box()
+        height = self.state or 0
+
+        draw.rectangle(self.rect, fill=bg)
+        draw.text(((x0 + x1) / 2, y0), self.title, fill="black", font=_font(12), anchor="mt")
+        draw.rectangle((bx0, by0, bx1 - 1, by1 - 1), fill="white", outline="black")
+        if height > 0:
+            draw.rectangle((bx0 + 5, by1 - height, bx1 - 6, by1 - 2), fill=self.bar_color)
+
+
+class IndicatorCell(Cell):
+    """HorizontalIndicator look."""
+
+    def __init__(self, title="STR", col_name=None, min_value=-540, max_value=540, bar_color="lightgray",
+                 line_color="blue", midline_color="black", layout=None, **kwargs):
+        super().__init__(title, col_name, layout)
+        self.min_value = min_value
+        self.max_value = max_value
+        self.bar_color = bar_color
+        self.line_color = line_color
+        self.midline_color = midline_color
+        self.current_value = 0
+
+    def _bar_box(self):
+        x0, y0, x1, y1 = self.rect
+        return x0 + 50, y0 + 5, x1 - 5, y1 - 5
+
+    def visual_state(self, data):
+        if data.get(self.col_names[0]) is not None:
+            self.current_value = max(self.min_value, min(self.max_value, data[self.col_names[0]]))
+        if self.rect is None:
+            return None
+        bx0, _, bx1, _ = self._bar_box()
+        norm = (self.current_value - self.min_value) / (self.max_value - self.min_value)
+        return int(bx0 + norm * (bx1 - bx0))  # indicator x in pixels
+
+    def render(self, draw, bg):
+        x0, y0, x1, y1 = self.rect
+        bx0, by0, bx1, by1 = self._bar_box()
+        mid_y = (by0 + by1) / 2
+        mid_x = (bx0 + bx1) / 2
+
+        draw.rectangle(self.rect, fill=bg)
+        draw.text((x0, mid_y), self.title, fill="black", font=_font(12), anchor="lm")
+        draw.rectangle((bx0, by0, bx1, by1), fill="white", outline="black")
+        draw.rectangle((bx0, mid_y - 5, bx1, mid_y + 5), fill=self.bar_color)
+        draw.line((mid_x, by0, mid_x, by1), fill=self.midline_color)
+        if self.state is not None:
+            draw.line((self.state, by0, self.state, by1), fill=self.line_color, width=2)
+
+
+COMPOSITE_CELLS = {
+    "InfoBox": InfoCell,
+    "VerticalBar": BarCell,
+    "HorizontalIndicator": IndicatorCell,
+}
+
+
+class CompositePanel(ParentWidget):
+    """
+    One layout frame drawn into a single PIL image / PhotoImage.
+    widgets = the frame's widget definitions (type, properties, layout).
+    """
+    # Above this share of dirty area a full paste is cheaper than many copies
+    FULL_PASTE_FRACTION = 0.5
+
+    def __init__(self, parent, widgets=(), **kwargs):
+        super().__init__(parent, title="", col_names=[], **kwargs)
+
+        self.cells = []
+        for widget_def in widgets:
+            cell_class = COMPOSITE_CELLS[widget_def["type"]]
+            cell = cell_class(layout=widget_def.get("layout", {}), **widget_def.get("properties", {}))
+            self.cells.append(cell)
+            self.col_names.extend(cell.col_names)
+        self.title = ",".join(c.title for c in self.cells)
+
+        self.grid_rows = max((c.layout.get("row", 0) + c.layout.get("rowspan", 1) for c in self.cells), default=1)
+        self.grid_cols = max((c.layout.get("column", 0) + c.layout.get("columnspan", 1) for c in self.cells), default=1)
+
+        r, g, b = (v // 256 for v in self.winfo_rgb(self.master["bg"]))
+        self.panel_bg = (r, g, b)
+
+        self.image = None
+        self.draw = None
+        self.photo = None
+        self.full_pastes = 0
+        self.rect_copies = 0
+
+        self.label = tk.Label(self, bd=0, highlightthickness=0, bg=self.master["bg"])
+        self.label.pack(fill="both", expand=True)
+        self.bind("<Configure>", self._on_resize)
+
+    def _on_resize(self, event):
+        w, h = max(event.width, 1), max(event.height, 1)
+        if self.image is not None and self.image.size == (w, h):
+            return
+
+        self.image = Image.new("RGB", (w, h), self.panel_bg)
+        self.draw = ImageDraw.Draw(self.image)
+
+        # Grid cells the same way LayoutManager grids widgets (equal weights, 5 px pad)
+        cw, ch = w / self.grid_cols, h / self.grid_rows
+        for cell in self.cells:
+            lay = cell.layout
+            padx, pady = lay.get("padx", 5), lay.get("pady", 5)
+            col, row = lay.get("column", 0), lay.get("row", 0)
+            x0 = int(col * cw) + padx
+            y0 = int(row * ch) + pady
+            x1 = int((col + lay.get("columnspan", 1)) * cw) - padx
+            y1 = int((row + lay.get("rowspan", 1)) * ch) - pady
+            cell.rect = (x0, y0, max(x1, x0 + 1), max(y1, y0 + 1))
+            cell.state = None  # pixel states depend on the size
+
+        for cell in self.cells:
+            cell.render(self.draw, self.panel_bg)
+
+        self.photo = ImageTk.PhotoImage(self.image)
+        self.label.config(image=self.photo)
+
+    def update_data(self, data):
+        dirty = [cell for cell in self.cells if cell.update_data(data)]
+        if not dirty or self.image is None:
+            return
+
+        for cell in dirty:
+            cell.render(self.draw, self.panel_bg)
+
+        w, h = self.image.size
+        area = sum((c.rect[2] - c.rect[0]) * (c.rect[3] - c.rect[1]) for c in dirty)
+        if area > self.FULL_PASTE_FRACTION * w * h:
+            self.photo.paste(self.image)
+            self.full_pastes += 1
+            return
+
+        # Copy only the dirty rectangles into the displayed PhotoImage
+        for cell in dirty:
+            patch = ImageTk.PhotoImage(self.image.crop(cell.rect))
+            self.tk.call(str(self.photo), "copy", str(patch), "-to", cell.rect[0], cell.rect[1])
+            self.rect_copies += 1
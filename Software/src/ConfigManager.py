@@ -1,6 +1,6 @@
 import json
 from dataclasses import dataclass, field
-from typing import Dict, Any
+from typing import Dict, Any, List
 
 
 @dataclass
@@ -16,6 +16,27 @@ class MainConfig:
     framerate: int = 20
     layout_file: str = "layout.json"
     font_size: int = 16
+    web_decimation: str = "minmax"  # "minmax", "lttb" or "none"
+    web_lttb_points: int = 8
+    web_workers: int = 0  # >0 serves the web page from this many separate processes
+    shared_bus_name: str = ""  # shared memory name of the signal bus, "" = off
+    shared_bus_signals: int = 256
+    shared_bus_history: int = 1024
+    relay_targets: List[str] = field(default_factory=list)  # ["127.0.0.1:5003", "239.1.1.1:5004"]
+    relay_mode: str = "raw"  # "raw" ITV datagrams or "decoded" JSON
+    relay_commands: bool = False  # raw mode: also relay command/time sync datagrams (ITV id 0x01)
+    capture_dir: str = "captures"
+    profile_seconds: int = 10
+    render_overlay: bool = False
+    prebuild_layouts: List[str] = field(default_factory=list)  # built hidden at startup for fast switching
+    layout_cache_size: int = 3  # built layouts kept alive (visible one included)
+    extra_windows: List[str] = field(default_factory=list)  # layout files opened in their own window at startup
+    extra_window_framerate: int = 10
+    log_format: str = "events"  # "events" (change-only, every signal), "bin"/"csv" rows per packet (columns fixed at start)
+    log_keyframe_interval: float = 1.0  # events format: seconds between full-state keyframes
+    log_fsync: str = "interval"  # "never", "interval" or "always"
+    log_fsync_interval: float = 1.0
+    log_overflow: str = "drop"  # writer behind: "drop" new rows or "grow" the buffers
 
 @dataclass
 class Command:
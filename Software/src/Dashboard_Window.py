@@ -0,0 +1,100 @@
+import tkinter as tk
+
+from LayoutBuilder import BindingTable
+from Render_Budget import RenderBudget
+
+# ==============================
+# Dashboard windows
+# ==============================
+# The dashboard pump ticks at the fastest window's rate and takes one
+# snapshot per tick; every window renders from that snapshot at its own
+# rate with its own render budget. Changes seen while a window was not due
+# (or hidden / minimized) are accumulated, and a window that becomes
+# visible again gets a full update.
+#
+# Each window keeps its own deadline grid (advanced by its period), so a
+# pump tick that fires a little early does not cost the window a frame.
+
+class DashboardWindow:
+    DEADLINE_SLACK = 0.002  # s, after() jitter / ms rounding of the pump
+    def __init__(self, top, name, layout_manager, signals, framerate):
+        self.top = top
+        self.name = name
+        self.layout_manager = layout_manager
+        self.signals = signals
+        self.framerate = framerate
+        self.period = 1.0 / framerate
+
+        self.render_budget = RenderBudget(framerate)
+        self.widgets = []
+        self.bindings = BindingTable([], signals)
+
+        self.pending = set()  # signal indices changed since this window last rendered
+        self.force_full = True
+        self.last_render = 0
+        self.next_due = 0.0
+        self.last_full_update = 0
+        self.last_dispatch = 0
+        self.rendered = 0
+        self.skipped_hidden = 0
+
+    def set_widgets(self, widgets):
+        """New widget set: reset render stats and compile the signal -> widget bindings."""
+        self.widgets = widgets
+        self.render_budget.set_widgets(widgets)
+        self.bindings = BindingTable(widgets, self.signals)
+        self.force_full = True
+
+    def visible(self):
+        """False when withdrawn, minimized (unmapped) or destroyed."""
+        try:
+            return bool(self.top.winfo_viewable())
+        except tk.TclError:
+            return False
+
+    def tick(self, now, changed, snapshot, idle_refresh):
+        """
+        Called by the pump every tick. snapshot() returns the tick's shared
+        SignalDict (taken on first use). Returns True if the window rendered.
+        """
+        self.pending |= changed
+
+        if now < self.next_due - self.DEADLINE_SLACK:
+            return False
+
+        if not self.visible():
+            self.skipped_hidden += 1
+            self.force_full = True
+            return False
+
+        # Data frames only reach widgets bound to a changed signal, a full
+        # frame every idle_refresh keeps age colours moving
+        full = self.force_full or now - self.last_full_update >= idle_refresh
+        if not full and not self.pending:
+            return False
+
+        if full:
+            self.last_full_update = now
+            self.force_full = False
+            only = None
+        else:
+            only = self.bindings.widgets_for(self.pending)
+        self.pending = set()
+        self.last_dispatch = self.bindings.n_widgets if only is None else len(only)
+
+        self.render_budget.run_frame(snapshot(), only)
+        self.last_render = now
+        # Stay on the grid, deadlines missed while idle / late are skipped
+        self.next_due += self.period
+        if self.next_due <= now:
+            self.next_due = now + self.period
+        self.rendered += 1
+        return True
+
+    def stats_lines(self):
+        state = "visible" if self.visible() else "hidden"
+        lines = [f"Window {self.name} ({state}, {self.framerate} fps): rendered {self.rendered}, "
+                 f"skipped hidden {self.skipped_hidden}, "
+                 f"last frame updated {self.last_dispatch}/{self.bindings.n_widgets} widgets"]
+        lines.extend("  " + line for line in self.render_budget.stats_lines(5))
+        return lines
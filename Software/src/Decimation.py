@@ -0,0 +1,203 @@
+import math
+import threading
+import time
+from collections import deque
+
+import numpy as np
+
+# ==============================
+# Decimation helpers
+# ==============================
+def lttb(points, n_out):
+    """
+    Largest-Triangle-Three-Buckets downsampling.
+    points = list of (t, v) sorted by t
+    Keeps first/last point and the most "visually important" point per bucket.
+    """
+    n = len(points)
+    if n_out >= n or n_out < 3:
+        return list(points)
+
+    out = [points[0]]
+    bucket_size = (n - 2) / (n_out - 2)
+    a = 0
+
+    for i in range(n_out - 2):
+        # Average of the next bucket is the third triangle corner
+        next_start = int((i + 1) * bucket_size) + 1
+        next_end = min(int((i + 2) * bucket_size) + 1, n)
+        count = max(next_end - next_start, 1)
+        avg_t = sum(p[0] for p in points[next_start:next_end]) / count
+        avg_v = sum(p[1] for p in points[next_start:next_end]) / count
+
+        start = int(i * bucket_size) + 1
+        end = int((i + 1) * bucket_size) + 1
+
+        at, av = points[a]
+        best_area = -1.0
+        best = start
+
+        for j in range(start, end):
+            t, v = points[j]
+            area = abs((at - avg_t) * (v - av) - (at - t) * (avg_v - av))
+            if area > best_area:
+                best_area = area
+                best = j
+
+        out.append(points[best])
+        a = best
+
+    out.append(points[-1])
+    return out
+
+
+class StreamDecimator:
+    """
+    Summarises every sample seen since the last drain().
+    mode = "minmax" -> per channel [min, max, n]
+    mode = "lttb"   -> per channel [[age_ms, value], ...] with at most lttb_points
+    """
+    MODES = ("minmax", "lttb")
+
+    def __init__(self, mode="minmax", lttb_points=8, max_samples=2000):
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown decimation mode: {mode}")
+        if mode == "lttb" and (not isinstance(lttb_points, int) or lttb_points < 3):
+            raise ValueError(f"lttb_points must be an integer >= 3, got {lttb_points!r}")
+
+        self.mode = mode
+        self.lttb_points = lttb_points
+        self.max_samples = max_samples
+
+        self._lock = threading.Lock()
+        self._pending = {}
+
+    def add(self, name: str, value, ts: float):
+        """SignalStore listener - called from the ingest threads."""
+        try:
+            val = float(value)
+        except (TypeError, ValueError):
+            return
+        if math.isnan(val):
+            return
+
+        with self._lock:
+            entry = self._pending.get(name)
+
+            if self.mode == "minmax":
+                if entry is None:
+                    self._pending[name] = [val, val, 1]
+                else:
+                    if val < entry[0]:
+                        entry[0] = val
+                    if val > entry[1]:
+                        entry[1] = val
+                    entry[2] += 1
+            else:
+                if entry is None:
+                    entry = self._pending[name] = deque(maxlen=self.max_samples)
+                entry.append((ts, val))
+
+    def drain(self) -> dict:
+        """Return the summary since the last call and start a new one."""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+
+        if self.mode == "minmax":
+            return pending
+
+        now = time.monotonic()
+        out = {}
+        for name, samples in pending.items():
+            points = lttb(list(samples), self.lttb_points)
+            out[name] = [[round((t - now) * 1000, 1), v] for t, v in points]
+
+        return out
+
+
+# ==============================
+# Plot decimation (NumPy)
+# ==============================
+def minmax_blocks(x, y, k):
+    """
+    Split y into whole blocks of k samples and keep the min and the max of
+    each block, in time order. Returns (x, y) arrays of shape (blocks, 2).
+    All-NaN blocks come out as NaN (a gap in the line).
+    """
+    nb = len(y) // k
+    yb = y[:nb * k].reshape(nb, k)
+    nan = np.isnan(yb)
+    lo = np.where(nan, np.inf, yb).argmin(axis=1)
+    hi = np.where(nan, -np.inf, yb).argmax(axis=1)
+
+    base = np.arange(nb) * k
+    idx = np.stack([base + np.minimum(lo, hi), base + np.maximum(lo, hi)], axis=1)
+    return x[idx], y[idx]
+
+
+class MinMaxCache:
+    """
+    Min/max decimation of one scrolling series down to ~2 points per pixel
+    column, so spikes survive no matter how long the window is.
+
+    Blocks are aligned to the absolute sample index and the block size is a
+    power of two, so a completed block never changes while the window
+    scrolls: those are cached and only new blocks (plus the partial ones at
+    both ends) are computed per frame. This assumes roughly evenly spaced
+    samples, which holds for plots fed once per GUI frame.
+    """
+
+    def __init__(self):
+        self.reset(None)
+
+    def reset(self, k):
+        self.k = k
+        self.first_block = 0
+        self.next_block = None
+        self.bx = np.empty((0, 2))
+        self.by = np.empty((0, 2))
+
+    def decimate(self, x, y, start, n_pixels):
+        """x, y: the window (views are fine), start: absolute index of x[0]."""
+        n = len(y)
+        if n <= 2 * n_pixels:
+            return x, y
+
+        k = 1 << math.ceil(math.log2(n / n_pixels))
+        if k != self.k:
+            self.reset(k)
+
+        end = start + n
+        b_lo = -(-start // k)  # first whole block in the window
+        b_hi = end // k        # one past the last whole block
+
+        if self.next_block is None or self.first_block > b_lo or self.next_block < b_lo:
+            self.reset(k)
+            self.first_block = self.next_block = b_lo
+        elif b_lo > self.first_block:
+            drop = b_lo - self.first_block
+            self.bx, self.by = self.bx[drop:], self.by[drop:]
+            self.first_block = b_lo
+
+        if b_hi > self.next_block:
+            i0 = self.next_block * k - start
+            i1 = b_hi * k - start
+            nx, ny = minmax_blocks(x[i0:i1], y[i0:i1], k)
+            self.bx = np.concatenate((self.bx, nx))
+            self.by = np.concatenate((self.by, ny))
+            self.next_block = b_hi
+
+        # Partial blocks at either end are recomputed every time
+        head = b_lo * k - start
+        tail = b_hi * k - start
+        parts_x, parts_y = [], []
+        for seg in (slice(0, head), None, slice(tail, n)):
+            if seg is None:
+                parts_x.append(self.bx.ravel())
+                parts_y.append(self.by.ravel())
+            elif seg.stop > seg.start:
+                px, py = minmax_blocks(x[seg], y[seg], seg.stop - seg.start)
+                parts_x.append(px.ravel())
+                parts_y.append(py.ravel())
+
+        return np.concatenate(parts_x), np.concatenate(parts_y)
@@ -9,9 +9,29 @@ from aiohttp import web
 from ConfigManager import *
 import queue
 from testing import *
+from Decimation import *
+from Web_Fanout import *
+from Signal_Bus import *
+from Udp_Relay import *
+from Packet_Capture import *
+from Latency_Tracer import *
+from Metrics import *
+from Gui_Queue import *
 import math
+import json
 
 debug = False
+
+# Hot-path counters, exported on /metrics
+PACKETS_UDP = metrics.counter("jvs_packets_received_total", "Telemetry packets received", {"transport": "udp"})
+PACKETS_LORA = metrics.counter("jvs_packets_received_total", "Telemetry packets received", {"transport": "lora"})
+DECODE_ERRORS_UDP = metrics.counter("jvs_decode_errors_total", "Packets that failed ITV decode", {"transport": "udp"})
+DECODE_ERRORS_LORA = metrics.counter("jvs_decode_errors_total", "Packets that failed ITV decode", {"transport": "lora"})
+LISTENER_ERRORS = metrics.counter("jvs_signal_listener_errors_total", "Exceptions raised by SignalStore listeners (decimator, bus, logger)")
+INGEST_ERRORS_LORA = metrics.counter("jvs_ingest_errors_total", "Unexpected errors in the ingest loop after decode", {"transport": "lora"})
+UNKNOWN_IDS = metrics.counter("jvs_unknown_signal_ids_total", "ITV values with no registered signal name")
+BROADCAST_SECONDS = metrics.gauge("jvs_broadcast_seconds", "Duration of the last WebSocket broadcast")
+BROADCAST_SECONDS_TOTAL = metrics.counter("jvs_broadcast_seconds_total", "Time spent in WebSocket broadcasts")
 # ==============================
 # Parser Layer
 # ==============================
@@ -38,12 +58,81 @@ class SignalDict(dict):
 class SignalStore:
     def __init__(self):
         self._signals: dict[str, SignalValue] = {}
+        self.listeners = []
+        self._failed_listeners = set()  # reported once each
+        self.version = 0  # bumped on every update, lets consumers skip unchanged frames
+
+        # Stable index per signal name + the indices updated since the GUI last looked
+        self.index: dict[str, int] = {}
+        self._changed = set()
+        self._index_lock = threading.Lock()
+
+        # Latest version for the GUI; versions replaced before it looked are
+        # counted as overwritten snapshots
+        self.mailbox = LatestMailbox()
+
+    def register_listener(self, callback):
+        """callback(name, value, mono_ts) is called on the updating thread."""
+        self.listeners.append(callback)
+
+    def signal_index(self, name: str) -> int:
+        """Small integer for a signal name, allocated on first use (also before any data)."""
+        idx = self.index.get(name)
+        if idx is None:
+            with self._index_lock:
+                idx = self.index.setdefault(name, len(self.index))
+        return idx
+
+    def signal_names(self) -> list:
+        """Names in index order, copied under the lock new names are added with."""
+        with self._index_lock:
+            return list(self.index)
+
+    def _signals_copy(self) -> dict:
+        """
+        Copy of the name -> SignalValue map that is safe while ingest threads
+        insert new names (dict copy is one C call, retried if it still races).
+        """
+        while True:
+            try:
+                return dict(self._signals)
+            except RuntimeError:
+                continue
+
+    def take_changed(self) -> set:
+        """
+        Indices of the signals updated since the previous call (single consumer:
+        the GUI). Empty without taking the index lock if the mailbox is empty.
+        """
+        if self.mailbox.take() is None:
+            return set()
+        with self._index_lock:
+            changed, self._changed = self._changed, set()
+        return changed
 
     def update(self, name: str, value: float):
+        now = time.monotonic()
         self._signals[name] = SignalValue(
             value=value,
-            mono_ts=time.monotonic()
+            mono_ts=now
         )
+        self.version += 1
+
+        idx = self.signal_index(name)
+        with self._index_lock:
+            self._changed.add(idx)
+        # After _changed: a GUI that sees the version also sees the index
+        self.mailbox.put(self.version)
+
+        for callback in self.listeners:
+            try:
+                callback(name, value, now)
+            except Exception as e:
+                # One broken consumer must not stop ingest or the others
+                LISTENER_ERRORS.inc()
+                if callback not in self._failed_listeners:
+                    self._failed_listeners.add(callback)
+                    print(f"Signal listener {getattr(callback, '__qualname__', callback)} failed: {e!r}")
 
     def get(self, name: str, max_age: float | None = None):
         sig = self._signals.get(name)
@@ -58,7 +147,7 @@ class SignalStore:
         now = time.monotonic()
         out = {}
 
-        for name, sig in self._signals.items():
+        for name, sig in self._signals_copy().items():
             if max_age is not None and (now - sig.mono_ts > max_age):
                 out[name] = float("nan")
             else:
@@ -71,14 +160,16 @@ class SignalStore:
         now = time.monotonic()
         out = {}
 
-        for name, sig in self._signals.items():
+        for name, sig in self._signals_copy().items():
             out[name] = sig.mono_ts
 
         return out
 
     def get_latest_telem(self):
-        values = self.snapshot_values()
-        meta   = self.snapshot_meta()
+        # One copy for both, so every value has its timestamp
+        signals = self._signals_copy()
+        values = {name: sig.value for name, sig in signals.items()}
+        meta   = {name: sig.mono_ts for name, sig in signals.items()}
 
         return SignalDict(values, meta)
 # ==============================
@@ -93,11 +184,76 @@ class TelemetryController:
         self.sigNamesRequested = True
 
         # Layers
-        self.logger = SessionLogger()
+        self.logger = SessionLogger(
+            log_format=config.main.log_format,
+            fsync=config.main.log_fsync,
+            fsync_interval=config.main.log_fsync_interval,
+            overflow=config.main.log_overflow,
+            keyframe_interval=config.main.log_keyframe_interval
+        )
         self.signals = SignalStore()
+        self.telem_mailbox = self.signals.mailbox  # latest SignalStore version for the GUI
         self.server = TelemetryWebServer(self.signals, "0.0.0.0", self.config.main.webserver_port)
         self.server.set_channel_meta(config.web_meta.widgets)
 
+        # Session log records every sample at ingest (no-op while not logging)
+        self.signals.register_listener(self.logger.log_signal)
+
+        # Web stream decimation (summary of all samples between broadcasts)
+        self.decimator = None
+        if config.main.web_decimation != "none":
+            try:
+                self.decimator = StreamDecimator(config.main.web_decimation, config.main.web_lttb_points)
+                self.signals.register_listener(self.decimator.add)
+                self.server.set_decimator(self.decimator)
+            except (ValueError, TypeError) as e:
+                self.decimator = None
+                print(f"Web decimation disabled: {e}")
+
+        # Shared-memory copy of the signal state for other processes
+        self.bus = None
+        if config.main.shared_bus_name:
+            try:
+                self.bus = SharedSignalBus(
+                    config.main.shared_bus_name,
+                    config.main.shared_bus_signals,
+                    config.main.shared_bus_history
+                )
+                self.signals.register_listener(self.bus.update)
+            except Exception as e:
+                print(f"Signal bus disabled: {e}")
+
+        # Re-broadcast of vehicle traffic to other local tools
+        self.relay = None
+        if config.main.relay_targets:
+            try:
+                self.relay = UdpRelay(config.main.relay_targets, config.main.relay_mode,
+                                      relay_commands=config.main.relay_commands)
+            except (ValueError, OSError) as e:
+                print(f"UDP relay disabled: {e}")
+
+        # Multi-process web server (start_web_fanout)
+        self.fanout = None
+
+        # Raw packet capture (see Packet_Capture.py for replay)
+        self.capture = None
+
+        # Receipt -> decode -> store -> screen / web latency
+        self.tracer = LatencyTracer()
+        self.server.set_metrics_provider(self.metrics_text)
+
+        metrics.gauge("jvs_signal_store_size", "Signals held in the SignalStore", fn=lambda: len(self.signals._signals))
+        metrics.gauge("jvs_websocket_clients", "Connected WebSocket clients", fn=self.websocket_clients)
+        metrics.gauge("jvs_fanout_frames_skipped", "Frames a slow web worker never received", fn=lambda: self.fanout.skipped() if self.fanout else 0)
+        metrics.gauge("jvs_logger_buffer_depth", "Telemetry rows waiting to be written", fn=self.logger_buffer_depth)
+        metrics.gauge("jvs_log_write_queue_depth", "Log buffers waiting for the writer thread", fn=lambda: self.logger.writer.depth())
+        metrics.gauge("jvs_log_write_seconds_max", "Slowest recent log write (incl. fsync)", fn=lambda: max(self.logger.writer.latencies, default=0.0))
+        metrics.gauge("jvs_log_rows_dropped", "Telemetry rows dropped this session (writer behind)", fn=lambda: self.logger.stats()["dropped"])
+        metrics.gauge("jvs_log_samples_unlogged", "Samples of signals the session log format could not record", fn=lambda: self.logger.stats()["unlogged"])
+        metrics.gauge("jvs_gui_queue_depth", "Log/status messages waiting for the GUI", fn=lambda: self.gui_queue.qsize())
+        metrics.gauge("jvs_gui_queue_dropped", "Log/status messages dropped (queue full)", fn=lambda: getattr(self.gui_queue, "dropped", 0))
+        metrics.gauge("jvs_telem_snapshots_overwritten", "Telemetry updates replaced before the GUI drew them", fn=lambda: self.telem_mailbox.overwritten)
+
         # Ports
         self.HOST = config.main.host_ip
         self.TCP_PORT = config.main.tcp_port
@@ -123,6 +279,7 @@ class TelemetryController:
 
         threading.Thread(
             target=self.command_worker,
+            name="Commands",
             daemon=True
         ).start()
 
@@ -138,11 +295,32 @@ class TelemetryController:
             self.log(f"Marker added: {text}")
 
     def start_logging(self):
-        #self.logger.start_session(telem_cols=self.signal_names, notes="") #TODO: Fix logging
+        if self.logger.session_active:
+            return
+        names = self.signals.signal_names()
+        self.logger.start_session(telem_cols=names, notes="")
+        self.log(f"Logging started: log {self.logger.log_number}")
+        if self.logger.frame_rows:
+            # Row formats keep the columns known now, see SessionLogger
+            message = (f"Log format \"{self.logger.log_format}\" records only the {len(names)} signals "
+                       f"seen so far, signals first received later are not logged (use \"events\")")
+            print(message)
+            self.log(message)
         self.logging=True
     def stop_logging(self):
         self.logger.stop_session()
         self.logging=False
+    def start_capture(self, path=None):
+        if self.capture:
+            return
+        self.capture = PacketCapture(path or PacketCapture.default_path(self.config.main.capture_dir))
+        self.log(f"Packet capture started: {self.capture.path}")
+    def stop_capture(self):
+        if not self.capture:
+            return
+        capture, self.capture = self.capture, None
+        capture.close()
+        self.log("Packet capture stopped")
     def send_cmd(self, cmd, val=None):
         resp = b""
         resp += itv_u8(0x01, cmd)
@@ -158,6 +336,10 @@ class TelemetryController:
     def stop(self):
         self.running = False
         self.log("Exiting app...")
+        if self.bus:
+            self.bus.close()
+        self.stop_capture()
+        self.logger.close()
         #self.telem_logger.close()
         #self.timing_logger.close()
         sys.exit(0)
@@ -170,16 +352,28 @@ class TelemetryController:
 
         while True:
             data, addr = sock.recvfrom(1024)
+            rx_ts = self.tracer.now()
+            PACKETS_UDP.inc()
 
+            capture = self.capture
+            if capture:
+                capture.write(SOURCE_UDP, data)
+
+            itv_vals = None
             try:
                 itv_vals = decode_value_itv(data)
             except Exception as e:
                 print(e)
 
+            if self.relay and self.relay.mode == "raw":
+                self.relay.submit_raw(data, itv_vals)
+
             if not itv_vals:
+                DECODE_ERRORS_UDP.inc()
                 if debug:
                     print("Couldn't decode wifi ITV packet")
                 continue
+            self.tracer.record("decode", rx_ts)
 
             # -----------------------------
             # Timestamp + fake radio stats
@@ -199,6 +393,9 @@ class TelemetryController:
             if len(itv_vals) == 0:
                 continue
 
+            if self.relay and self.relay.mode == "decoded":
+                self.relay.submit(itv_vals)
+
             # -----------------------------
             # Debug print (clean)
             # -----------------------------
@@ -209,6 +406,8 @@ class TelemetryController:
 
 
             self.itv_to_signal_store(itv_vals)
+            self.log_packet_row()
+            self.tracer.packet_stored(rx_ts)
 
     def queue_send(self, payload_bytes):
         hex_out = payload_bytes.hex().upper()
@@ -248,6 +447,8 @@ class TelemetryController:
     def itv_to_signal_store(self, itv_vals: dict):
         for sig_id, raw_val in itv_vals.items():
             name = id_to_name.get(sig_id)
+            if not name:
+                UNKNOWN_IDS.inc()
             if not name and not self.sigNamesRequested:
                 self.sigNamesRequested = True
                 self.send_cmd(3)
@@ -393,14 +594,32 @@ class TelemetryController:
                 
                 # Step 1: Find start label "D:"
                 data = self.read_packet();
+                rx_ts = self.tracer.now()
+                if data:
+                    PACKETS_LORA.inc()
+
+                capture = self.capture
+                if data and capture:
+                    capture.write(SOURCE_LORA, data)
+
                 #print(data)
                 # Step 4: Decode
-                itv_vals = decode_value_itv(data)
+                try:
+                    itv_vals = decode_value_itv(data)
+                except Exception as e:
+                    itv_vals = None
+                    print(e)
+
+                if data and self.relay and self.relay.mode == "raw":
+                    self.relay.submit_raw(bytes(data), itv_vals)
 
                 if not itv_vals:
+                    if data:
+                        DECODE_ERRORS_LORA.inc()
                     if debug:
                         print("⚠ Empty or invalid Serial Line")
                     continue
+                self.tracer.record("decode", rx_ts)
 
                 # -----------------------------
                 # Command handling
@@ -410,6 +629,9 @@ class TelemetryController:
                 if len(itv_vals) == 0:
                     continue
 
+                if self.relay and self.relay.mode == "decoded":
+                    self.relay.submit(itv_vals)
+
                 # -----------------------------
                 # Debug print (clean)
                 # -----------------------------
@@ -422,18 +644,14 @@ class TelemetryController:
                 # Signal update
                 # -----------------------------
                 self.itv_to_signal_store(itv_vals)
-
-                # -----------------------------
-                # Push to GUI
-                # -----------------------------
-                self.gui_queue.put(
-                    ("telem_data", self.signals.get_latest_telem())
-                )
+                self.log_packet_row()
+                self.tracer.packet_stored(rx_ts)
 
             except KeyboardInterrupt:
                 break
 
             except Exception as e:
+                INGEST_ERRORS_LORA.inc()
                 print("Listener error:", e)
 
     def read_packet(self):
@@ -463,10 +681,68 @@ class TelemetryController:
     async def telemetry_loop(self):
         while True:
             data = self.signals.get_latest_telem()
+            start = time.perf_counter()
             await self.server.broadcast(data)
+            elapsed = time.perf_counter() - start
+            BROADCAST_SECONDS.set(elapsed)
+            BROADCAST_SECONDS_TOTAL.inc(elapsed)
+            if self.server.clients:
+                self.tracer.frame_sent()
             await asyncio.sleep(0.05)  # 20 Hz update rate
 
+    def start_web_fanout(self):
+        """Web server runs in worker processes, this thread only builds frames."""
+        self.fanout = WebFanoutPool(
+            self.server.host,
+            self.server.port,
+            self.config.main.web_workers,
+            self.server.channel_meta
+        )
+        self.fanout.start()
+
+        tick = 0
+        while self.running:
+            start = time.perf_counter()
+            frame = self.server.build_frame(self.signals.get_latest_telem())
+            self.fanout.publish(json.dumps(frame).encode())
+            elapsed = time.perf_counter() - start
+            BROADCAST_SECONDS.set(elapsed)
+            BROADCAST_SECONDS_TOTAL.inc(elapsed)
+            self.tracer.frame_sent()
+
+            # Workers serve /metrics from the last text pushed here
+            if tick % 20 == 0:
+                self.fanout.publish(METRICS_PREFIX + self.metrics_text().encode())
+            tick += 1
+
+            time.sleep(0.05)  # 20 Hz update rate
+
+        self.fanout.stop()
+
+    def websocket_clients(self):
+        """In fan-out mode the workers hold the clients, the local server has none."""
+        if self.fanout is not None:
+            return self.fanout.clients()
+        return len(self.server.clients)
+
+    def log_packet_row(self):
+        """Row-per-packet log formats ("bin", "csv"); the events format logs through the listener."""
+        if self.logger.session_active and self.logger.frame_rows:
+            self.logger.log_telemetry(self.signals.snapshot_values())
+
+    def logger_buffer_depth(self):
+        telem = self.logger.telemetry_logger
+        return telem.depth() if self.logger.session_active and telem else 0
+
+    def metrics_text(self) -> str:
+        lines = metrics.prometheus_lines() + self.tracer.prometheus_lines()
+        return "\n".join(lines) + "\n"
+
     def start_async_loop(self):
+        if self.config.main.web_workers > 0:
+            self.start_web_fanout()
+            return
+
         hostname = socket.gethostname()
         IPAddr = socket.gethostbyname(hostname)
 
@@ -496,9 +772,11 @@ class TelemetryController:
     # Start all listeners
     # ------------------------------
     def start_listeners(self):
-        threading.Thread(target=self.start_LoRa_listener, daemon=True).start()
-        threading.Thread(target=self.start_udp_telem_listener, daemon=True).start()
-        threading.Thread(target=self.start_async_loop, daemon=True).start()
+        threading.Thread(target=self.start_LoRa_listener, name="LoRa", daemon=True).start()
+        threading.Thread(target=self.start_udp_telem_listener, name="UDP", daemon=True).start()
+        threading.Thread(target=self.start_async_loop, name="Web", daemon=True).start()
+        if self.relay:
+            self.relay.start()
 
 class TelemetryWebServer:
     def __init__(self, signal_store, host="0.0.0.0", port=8080):
@@ -506,10 +784,13 @@ class TelemetryWebServer:
         self.host = host
         self.port = port
         self.channel_meta = {}
+        self.decimator = None
 
         self.app = web.Application()
         self.app.router.add_get("/", self.index)
         self.app.router.add_get("/ws", self.websocket_handler)
+        self.app.router.add_get("/metrics", self.metrics)
+        self.metrics_provider = None
 
         self.clients = set()
         print("Telem WebSocket Initialized")
@@ -517,6 +798,13 @@ class TelemetryWebServer:
     def set_channel_meta(self, channel_meta):
         self.channel_meta = channel_meta
 
+    def set_decimator(self, decimator):
+        self.decimator = decimator
+
+    def set_metrics_provider(self, provider):
+        """provider() -> Prometheus text exposition"""
+        self.metrics_provider = provider
+
     # --------------------------
     # HTTP (serves your webpage)
     # --------------------------
@@ -524,6 +812,13 @@ class TelemetryWebServer:
         print("New Client")
         return web.FileResponse("index.html")
 
+    # --------------------------
+    # Prometheus-style metrics
+    # --------------------------
+    async def metrics(self, request):
+        text = self.metrics_provider() if self.metrics_provider else ""
+        return web.Response(text=text, content_type="text/plain")
+
     # --------------------------
     # WebSocket handler
     # --------------------------
@@ -551,21 +846,40 @@ class TelemetryWebServer:
     # --------------------------
     # Broadcast telemetry
     # --------------------------
+    def build_frame(self, data: dict) -> dict:
+        frame = {
+            "type": "telemetry",
+            "channels": data
+        }
+
+        # Summary of every sample since the last frame so spikes survive
+        if self.decimator:
+            if self.decimator.mode == "minmax":
+                frame["envelope"] = self.decimator.drain()
+            else:
+                frame["series"] = self.decimator.drain()
+
+        return frame
+
     async def broadcast(self, data: dict):
         if not self.clients:
+            # Keep the decimation window aligned with the broadcast rate
+            if self.decimator:
+                self.decimator.drain()
             return
 
+        # Encode once, send the same string to every client
+        await self.send_to_clients(json.dumps(self.build_frame(data)))
+
+    async def send_to_clients(self, payload: str):
         dead_clients = []
 
-        for ws in self.clients:
+        for ws in list(self.clients):
             if ws.closed:
                 dead_clients.append(ws)
                 continue
 
-            await ws.send_json({
-                    "type": "telemetry",
-                    "channels": data
-                })
+            await ws.send_str(payload)
 
         # Cleanup dead connections
         for ws in dead_clients:
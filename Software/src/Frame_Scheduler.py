@@ -0,0 +1,79 @@
+import math
+import time
+from collections import deque
+
+# ==============================
+# GUI frame scheduler
+# ==============================
+# root.after(1000/framerate) after every frame drifts by however long the
+# frame took. This keeps a fixed deadline grid instead: the next delay is the
+# time left until the next deadline, and deadlines we already missed are
+# counted as dropped and skipped rather than rendered back to back.
+
+class FrameScheduler:
+    def __init__(self, framerate, max_queue_items=50, idle_refresh=0.5):
+        self.max_queue_items = max_queue_items
+        self.idle_refresh = idle_refresh  # render at least this often (age colours)
+        self.set_framerate(framerate)
+
+        self.ticks = 0
+        self.rendered = 0
+        self.skipped = 0
+        self.dropped = 0
+
+        self._tick_times = deque(maxlen=64)
+        self._render_times = deque(maxlen=64)
+
+    def set_framerate(self, framerate):
+        self.framerate = framerate
+        self.period = 1.0 / framerate
+        self.next_deadline = None
+
+    def frame_rendered(self):
+        self.rendered += 1
+        self._render_times.append(time.perf_counter())
+
+    def frame_skipped(self):
+        self.skipped += 1
+
+    def next_delay_ms(self) -> int:
+        """Call at the end of a tick, returns the delay for root.after."""
+        now = time.perf_counter()
+        self.ticks += 1
+        self._tick_times.append(now)
+
+        if self.next_deadline is None:
+            self.next_deadline = now
+
+        self.next_deadline += self.period
+
+        if now > self.next_deadline:
+            missed = int((now - self.next_deadline) / self.period) + 1
+            self.dropped += missed
+            self.next_deadline += missed * self.period
+
+        # Round up: firing early would land before the deadline
+        return max(0, math.ceil((self.next_deadline - now) * 1000))
+
+    @staticmethod
+    def _rate(times):
+        if len(times) < 2:
+            return 0.0
+        span = times[-1] - times[0]
+        return (len(times) - 1) / span if span > 0 else 0.0
+
+    def fps(self):
+        """Achieved tick rate (the cadence)."""
+        return self._rate(self._tick_times)
+
+    def render_fps(self):
+        """Frames that actually redrew widgets."""
+        if self._render_times and time.perf_counter() - self._render_times[-1] > 1.0:
+            return 0.0
+        return self._rate(self._render_times)
+
+    def stats_lines(self):
+        return [
+            f"GUI: {self.fps():.1f} fps (target {self.framerate}), rendering {self.render_fps():.1f} fps",
+            f"     dropped {self.dropped}  skipped (no new data) {self.skipped}"
+        ]
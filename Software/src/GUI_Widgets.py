@@ -1,15 +1,23 @@
 from Device_Manager import *
 import tkinter as tk
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import matplotlib.pyplot as plt
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import tkinter as tk
 import numpy as np
-from matplotlib.patches import Circle
 from typing import List
 import colorsys
 import math
+from Series_Buffer import SeriesRing
+
+# Matplotlib takes ~0.3 s to import, so it is loaded by the first plot
+# widget instead of at startup
+plt = None
+FigureCanvasTkAgg = None
+Circle = None
+
+def load_matplotlib():
+    global plt, FigureCanvasTkAgg, Circle
+    if plt is None:
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+        from matplotlib.patches import Circle
+        import matplotlib.pyplot as plt
 
 class ParentWidget(tk.Frame):
     def __init__(self, parent, title="Parent", col_names=[], **kwargs):
@@ -22,6 +30,37 @@ class ParentWidget(tk.Frame):
         """Placeholder method to update widget with data"""
         pass
 
+# ==============================
+# InfoBox border colour by data age
+# ==============================
+# 0s = green (120°) -> 10s = red (0°), then fading to half brightness at 20s.
+# Precomputed in AGE_STEP steps so update_data never calls colorsys, and the
+# colour string only changes (-> Tk call) when the age crosses a step.
+AGE_STEP = 0.1
+AGE_MAX = 20.0
+
+def _age_color(age_sec):
+    t = min(age_sec / 10.0, 1.0)
+
+    # Smooth easing
+    t = t * t * (3 - 2 * t)  # smoothstep
+
+    hue = (120 * (1 - t)) / 360.0
+
+    r, g, b = colorsys.hsv_to_rgb(hue, 1.0, 1.0)
+
+    # Fade brightness after 10s
+    if age_sec > 10:
+        brightness = max(0.5, 1.0 - (age_sec - 10) / 10)
+        r *= brightness
+        g *= brightness
+        b *= brightness
+
+    return f"#{int(r*255):02x}{int(g*255):02x}{int(b*255):02x}"
+
+AGE_COLOR_LUT = [_age_color(i * AGE_STEP) for i in range(int(AGE_MAX / AGE_STEP) + 1)]
+
+
 class InfoBox(ParentWidget):
     def __init__(self, parent, title="", col_name="", precision=2,
                  bg_color="grey", fg_color="white", corner_radius=35, alpha=0.8,
@@ -49,6 +88,12 @@ class InfoBox(ParentWidget):
         self.age_crit = age_crit
         self.age = None
 
+        # What the canvas currently shows, Tk is only called when these change
+        self.alpha_hex = f"{int(self.alpha * 255):02x}"
+        self._shown_text = None
+        self._shown_fill = None
+        self._shown_border = None
+
         # Create canvas
         self.canvas = tk.Canvas(self, highlightthickness=0, bg=self.master["bg"])
         self.canvas.pack(fill="both", expand=True)
@@ -89,28 +134,12 @@ class InfoBox(ParentWidget):
         if self.age is None:
             return self.bg_color
 
-        age_sec = max(0.0, self.age)
-
-        # 0s = green (120°)
-        # 10s = red (0°)
-        t = min(age_sec / 10.0, 1.0)
-
-        # Smooth easing
-        t = t * t * (3 - 2 * t)  # smoothstep
-
-        hue = (120 * (1 - t)) / 360.0
-
-        r, g, b = colorsys.hsv_to_rgb(hue, 1.0, 1.0)
-
-        # Fade brightness after 10s
-        if age_sec > 10:
-            brightness = max(0.5, 1.0 - (age_sec - 10) / 10)
-            r *= brightness
-            g *= brightness
-            b *= brightness
-
-        return f"#{int(r*255):02x}{int(g*255):02x}{int(b*255):02x}"
+        step = int(max(0.0, self.age) / AGE_STEP)
+        return AGE_COLOR_LUT[min(step, len(AGE_COLOR_LUT) - 1)]
 
+    def _get_fill_color(self):
+        fill_color = self._get_bg_color()
+        return fill_color + self.alpha_hex if fill_color.startswith("#") else fill_color
 
 
     def _draw_background(self):
@@ -120,11 +149,10 @@ class InfoBox(ParentWidget):
         border_width = 4
         r = min(self.corner_radius, w//4, h//4)
 
-        fill_color = self._get_bg_color()
+        fill_color = self._get_fill_color()
         border_color = self._get_border_color()
-
-        alpha_hex = f"{int(self.alpha * 255):02x}"
-        fill_color = fill_color + alpha_hex if fill_color.startswith("#") else fill_color
+        self._shown_fill = fill_color
+        self._shown_border = border_color
 
         # Clear old background
         if self.background_id:
@@ -154,18 +182,19 @@ class InfoBox(ParentWidget):
         )
 
     def _update_background(self):
-        fill_color = self._get_bg_color()
-        border_color = self._get_border_color()
-
-        alpha_hex = f"{int(self.alpha * 255):02x}"
-        fill_color = fill_color + alpha_hex if fill_color.startswith("#") else fill_color
-
         if not self.border_id or not self.background_id:
             self._draw_background()
             return
 
-        self.canvas.itemconfig(self.border_id, fill=border_color)
-        self.canvas.itemconfig(self.background_id, fill=fill_color)
+        border_color = self._get_border_color()
+        if border_color != self._shown_border:
+            self._shown_border = border_color
+            self.canvas.itemconfig(self.border_id, fill=border_color)
+
+        fill_color = self._get_fill_color()
+        if fill_color != self._shown_fill:
+            self._shown_fill = fill_color
+            self.canvas.itemconfig(self.background_id, fill=fill_color)
 
     def _draw_text(self):
         w = max(self.winfo_width(), 1)
@@ -194,6 +223,7 @@ class InfoBox(ParentWidget):
         cy = max(self.padding + 1, h/2)
         #formatted = f"{float(self.value):.{len(self.initial_value)}g}"
         formatted = self.value
+        self._shown_text = formatted
         self.value_id = self.canvas.create_text(cx, cy, anchor="center",
                                                 text=formatted,
                                                 fill=self.fg_color,
@@ -203,8 +233,10 @@ class InfoBox(ParentWidget):
         if not self.value_id:
             self._draw_text()
             return
-        
-        self.canvas.itemconfig(self.value_id, text=self.value)
+
+        if self.value != self._shown_text:
+            self._shown_text = self.value
+            self.canvas.itemconfig(self.value_id, text=self.value)
 
     @staticmethod
     def _create_rounded_rect(canvas, x1, y1, x2, y2, r=25, **kwargs):
@@ -244,23 +276,35 @@ class InfoBox(ParentWidget):
         self._update_text()
 
 class PlotBox(ParentWidget):
+    # Blit mode: fraction of the data span left free on the right so the
+    # background only has to be re-rendered every so often while scrolling
+    HEADROOM = 0.2
+    X = "__x__"  # buffer column holding the x values
+
     def __init__(self, parent, title="", col_names=None, colors=None,
-                 y_limits=None, keep_all=True, max_seconds=500, y_labels=None, compact=False, **kwargs):
+                 y_limits=None, keep_all=True, max_seconds=500, y_labels=None, compact=False, blit=True,
+                 capacity=36000, **kwargs):
         super().__init__(parent, **kwargs)
 
         if col_names is None:
             return
 
+        load_matplotlib()
         self.title = title
         self.col_names = col_names
-        self.x_data = []
-        self.y_data = {name: [] for name in col_names[1:]}
-        self.x_data_disp = []
-        self.y_data_disp = {name: [] for name in col_names[1:]}
+        # Bounded storage (capacity samples, ~30 min at 20 fps), "keep all" keeps this much
+        self.buffer = SeriesRing([self.X] + col_names[1:], capacity)
+        self.disp_start = 0
+        self.x_data_disp = self.buffer.column(self.X, 0)
+        self.y_data_disp = {name: self.buffer.column(name, 0) for name in col_names[1:]}
+        self.decimators = {name: MinMaxCache() for name in col_names[1:]}
         self.compact = compact
         self.last_plot = 0
         self.plot_rate = 10
         self.resizing = False
+        self.blit = blit
+        self.background = None
+        self._legend_text = None
 
         # Colors
         self.colors = colors if colors else ["blue", "red", "green", "orange", "purple", "brown"][:len(col_names)-1]
@@ -285,7 +329,6 @@ class PlotBox(ParentWidget):
 
         self.keep_all = keep_all
         self.max_seconds = max_seconds
-        self.ts_data = []
 
         # Create figure and main axes
         self.fig, self.ax = plt.subplots(figsize=(6,4))
@@ -309,13 +352,15 @@ class PlotBox(ParentWidget):
                 [],
                 color=self.colors[i],
                 label=name,
-                linewidth=1.2
+                linewidth=1.2,
+                animated=self.blit
             )
 
             self.lines[name] = line
 
         self.canvas = FigureCanvasTkAgg(self.fig, master=self)
         self.canvas.get_tk_widget().pack(fill="both", expand=True)
+        self.canvas.mpl_connect("draw_event", self._on_draw)
 
         if not compact:
             self.ax.set_xlabel(col_names[0])
@@ -356,54 +401,65 @@ class PlotBox(ParentWidget):
         dpi = self.fig.get_dpi()
         self.fig.set_size_inches(event.width / dpi, event.height / dpi)
         #self.fig.tight_layout()
+        self.background = None
         self.canvas.draw_idle()
         self.resizing = False
 
+    def _on_draw(self, event):
+        """Full redraw finished: cache everything except the lines as the blit background."""
+        if not self.blit:
+            return
+        self.background = self.canvas.copy_from_bbox(self.fig.bbox)
+        for line in self.lines.values():
+            line.axes.draw_artist(line)
+
+    def _update_limits(self, ax, x_range, y_range, ylim):
+        """Blit mode: move the view only when the data leaves it. Returns True if it moved."""
+        changed = False
+
+        if x_range is not None:
+            xmin, xmax = x_range
+            x0, x1 = ax.get_xlim()
+            span = max(xmax - xmin, 1e-9)
+            if xmin < x0 or xmax > x1 or span < 0.5 * (x1 - x0):
+                ax.set_xlim(xmin, xmax + self.HEADROOM * span)
+                changed = True
+
+        if ylim is None and y_range is not None:
+            ymin, ymax = y_range
+            y0, y1 = ax.get_ylim()
+            span = ymax - ymin
+            pad = 0.1 * span if span > 0 else max(abs(ymax) * 0.1, 0.5)
+            if ymin < y0 or ymax > y1 or (span > 0 and span < 0.5 * (y1 - y0)):
+                ax.set_ylim(ymin - pad, ymax + pad)
+                changed = True
+
+        return changed
+
     def update_data(self, data):
         now = time.monotonic()
 
-        # --- append timestamp ---
-        self.ts_data.append(now)
-
-        # --- append x ---
+        # --- x ---
         if self.col_names[0] == "INDEX":
-            self.x_data.append(self.x_data[-1] + 1 if self.x_data else 0)
+            x = self.buffer.count
         elif self.col_names[0] == "TIME":
             #Age based on age of the first data field #TODO: Maybe this is a bad idea
-            self.x_data.append(data.timestamp(self.col_names[1]))
+            x = data.timestamp(self.col_names[1])
         else:
-            self.x_data.append(data.get(self.col_names[0], float("nan")))
+            x = data.get(self.col_names[0], float("nan"))
 
-        # --- append y ---
-        for name in self.col_names[1:]:
-            self.y_data[name].append(data.get(name, float("nan")))
+        # --- append x, y ---
+        self.buffer.append(now, [x] + [data.get(name, float("nan")) for name in self.col_names[1:]])
 
-        # --- rolling buffer (TIME BASED) ---
+        # --- rolling window (TIME BASED) ---
         if self.keep_all or self.max_seconds == 0:
-            self.x_data_disp = self.x_data
-            self.y_data_disp = self.y_data
+            self.disp_start = self.buffer.first
         else:
-            cutoff = now - self.max_seconds
-
-            # find first index >= cutoff
-            start = 0
-            for i, ts in enumerate(self.ts_data):
-                if ts >= cutoff:
-                    start = i
-                    break
-            else:
-                start = len(self.ts_data)
+            self.disp_start = self.buffer.window_start(now - self.max_seconds)
 
-            self.x_data_disp = self.x_data[start:]
-            self.y_data_disp = {n: v[start:] for n, v in self.y_data.items()}
-
-            # OPTIONAL: prune old data permanently to avoid unbounded growth
-            #self.ts_data = self.ts_data[start:]
-            #self.x_data = self.x_data[start:]
-            #for n in self.y_data:
-            #    self.y_data[n] = self.y_data[n][start:]
-
-        now = time.monotonic()
+        # Views into the ring buffer, no copies
+        self.x_data_disp = self.buffer.column(self.X, self.disp_start)
+        self.y_data_disp = {n: self.buffer.column(n, self.disp_start) for n in self.col_names[1:]}
 
         # Update Plot at individual widget refresh rate
         #TODO: Add to config file
@@ -454,6 +510,9 @@ class PlotBox(ParentWidget):
         cols = self.col_names[1:]
         n = min(len(self.axes), len(cols), len(self.colors), len(self.y_limits), len(self.y_labels))
         legend_lines = []
+        rescaled = False
+        x_range = self.buffer.extrema(self.X, self.disp_start)
+        n_pixels = max(int(self.ax.bbox.width), 100)
 
         for i in range(n):
             ax = self.axes[i]
@@ -461,13 +520,8 @@ class PlotBox(ParentWidget):
             ylim = self.y_limits[i]
 
             x = self.x_data_disp
-            y = self.y_data_disp.get(name, [float("nan")] * len(x))
-
-            # Defensive length fix
-            if len(x) != len(y):
-                min_len = min(len(x), len(y))
-                x, y = x[-min_len:], y[-min_len:]
-
+            y = self.y_data_disp[name]
+            y_range = self.buffer.extrema(name, self.disp_start)
 
             if ylim is not None:
                 ax.set_ylim(ylim)
@@ -478,31 +532,39 @@ class PlotBox(ParentWidget):
                 self.line_width = 1.2
 
                 # Collect min/max for legend box
-                if len(y):
-                    arr = np.array([val for val in y if val is not None and not np.isnan(val)])
-                    if arr.size > 0:
-                        ymin, ymax = np.min(arr), np.max(arr)
-                        legend_lines.append(f"{name} [{ymin:.2f}, {ymax:.2f}]")
+                if y_range is not None:
+                    ymin, ymax = y_range
+                    legend_lines.append(f"{name} [{ymin:.2f}, {ymax:.2f}]")
             line = self.lines[name]
 
-            MAX_POINTS = 1000
+            # Keep min and max per pixel column (spikes stay visible)
+            x, y = self.decimators[name].decimate(x, y, self.disp_start, n_pixels)
 
-            if len(x) > MAX_POINTS:
-                step = math.ceil(len(x) / MAX_POINTS)
-                x = x[::step]
-                y = y[::step]
-                    
-            line.set_data(x, y)
-            ax.relim()
-            ax.autoscale_view()
-            
-            
+            # Copy: the ring slots get reused before a draw_idle may run (at most ~2 per pixel)
+            line.set_data(np.array(x), np.array(y))
+            if self.blit:
+                rescaled |= self._update_limits(ax, x_range, y_range, ylim)
+            else:
+                ax.relim()
+                ax.autoscale_view()
 
         #self.fig.tight_layout()
-        self.canvas.draw_idle()
-
-        # Update custom legend box
-        if legend_lines:
+        if not self.blit:
+            self.canvas.draw_idle()
+        elif rescaled or self.background is None:
+            # Limits moved: re-render axes/ticks, _on_draw caches the new background
+            self.canvas.draw()
+        else:
+            # Only the lines changed
+            self.canvas.restore_region(self.background)
+            for line in self.lines.values():
+                line.axes.draw_artist(line)
+            self.canvas.blit(self.fig.bbox)
+
+        # Update custom legend box (Tk text edits are not free, skip if unchanged)
+        legend_text = "\n".join(legend_lines)
+        if legend_lines and legend_text != self._legend_text:
+            self._legend_text = legend_text
             self.legend_box.config(state="normal")
             self.legend_box.delete("1.0", "end")
 
@@ -518,7 +580,8 @@ class PlotBox(ParentWidget):
 
 class PlotViewer(ParentWidget):
     def __init__(self, parent, title="", col_names=None, colors=None,
-                 y_limits=None, keep_all=True, max_seconds=500, y_labels=None, compact=False, **kwargs):
+                 y_limits=None, keep_all=True, max_seconds=500, y_labels=None, compact=False, blit=True,
+                 capacity=36000, **kwargs):
         super().__init__(parent, **kwargs)
 
         if col_names is None:
@@ -536,7 +599,7 @@ class PlotViewer(ParentWidget):
 
         # Create PlotBox in right frame
         self.plot = PlotBox(self.plot_frame, title, col_names, colors,
-                 y_limits, keep_all, max_seconds, y_labels, compact, **kwargs)
+                 y_limits, keep_all, max_seconds, y_labels, compact, blit=blit, capacity=capacity, **kwargs)
         self.plot.pack(fill="both", expand=True)
 
         # Track active button
@@ -575,17 +638,203 @@ class PlotViewer(ParentWidget):
                 else:
                     child.config(bg="SystemButtonFace")
 
+class StripChart(ParentWidget):
+    """
+    Lightweight PlotBox replacement drawn straight on a Tk Canvas (no
+    Matplotlib). Takes the same layout properties as PlotBox. Each series is
+    one canvas line item whose coordinates are replaced per frame, and each
+    series is scaled to its own y range like PlotBox's twin axes.
+    """
+    X = PlotBox.X
+
+    def __init__(self, parent, title="", col_names=None, colors=None,
+                 y_limits=None, keep_all=True, max_seconds=500, y_labels=None, compact=False, blit=True,
+                 capacity=36000, **kwargs):
+        super().__init__(parent, title=title, col_names=col_names, **kwargs)
+
+        if col_names is None:
+            return
+
+        names = col_names[1:]
+        self.keep_all = keep_all
+        self.max_seconds = max_seconds
+        self.compact = compact
+        self.last_plot = 0
+        self.plot_rate = 30
+        self.line_width = 2.5 if compact else 1.2
+
+        # Colors
+        self.colors = colors if colors else ["blue", "red", "green", "orange", "purple", "brown"][:len(names)]
+
+        # Y-limits
+        if y_limits is None:
+            self.y_limits = [None] * len(names)
+        elif isinstance(y_limits[0], (int, float)):
+            self.y_limits = [y_limits] * len(names)
+        else:
+            self.y_limits = y_limits
+        if len(self.y_limits) != len(names):
+            raise ValueError("Length of y_limits must match number of y columns")
+
+        # Y-axis labels (used in the legend)
+        if y_labels is None:
+            self.y_labels = list(names)
+        elif isinstance(y_labels, str):
+            self.y_labels = [y_labels] * len(names)
+        else:
+            self.y_labels = y_labels
+
+        self.buffer = SeriesRing([self.X] + names, capacity)
+        self.disp_start = 0
+        self.decimators = {name: MinMaxCache() for name in names}
+
+        # Canvas and items (created once, only coords/text change afterwards)
+        self.canvas = tk.Canvas(self, bg="white", highlightthickness=0)
+        self.canvas.pack(fill="both", expand=True)
+        self.width = self.height = 1
+
+        self.pad_x = 6
+        self.pad_top = 4 if compact else 22
+        self.pad_bottom = 4 if compact else 16
+
+        self.line_items = {}
+        for i, name in enumerate(names):
+            self.line_items[name] = self.canvas.create_line(
+                0, 0, 0, 0, fill=self.colors[i], width=self.line_width)
+
+        self.legend_items = {}
+        self._legend_text = {}
+        self._span_text = None
+        if not compact:
+            self.frame_item = self.canvas.create_rectangle(0, 0, 0, 0, outline="grey")
+            self.title_item = self.canvas.create_text(
+                0, 3, text=title, anchor="n", font=("TkDefaultFont", 11, "bold"))
+            self.span_item = self.canvas.create_text(
+                0, 0, text="", anchor="se", fill="grey", font=("TkDefaultFont", 9))
+            for i, name in enumerate(names):
+                self.legend_items[name] = self.canvas.create_text(
+                    0, 0, text="", anchor="nw", fill=self.colors[i], font=("TkDefaultFont", 10))
+
+        self.canvas.bind("<Configure>", self._on_resize)
+
+    def _on_resize(self, event):
+        self.width, self.height = event.width, event.height
+
+        if not self.compact:
+            left, right = self.pad_x, self.width - self.pad_x
+            top, bottom = self.pad_top, self.height - self.pad_bottom
+            self.canvas.coords(self.frame_item, left, top, right, bottom)
+            self.canvas.coords(self.title_item, self.width / 2, 3)
+            self.canvas.coords(self.span_item, right, self.height - 1)
+            for i, item in enumerate(self.legend_items.values()):
+                self.canvas.coords(item, left + 4, top + 3 + 15 * i)
+
+        # Redraw on the next update
+        self.last_plot = 0
+
+    def update_data(self, data):
+        now = time.monotonic()
+
+        # --- x ---
+        if self.col_names[0] == "INDEX":
+            x = self.buffer.count
+        elif self.col_names[0] == "TIME":
+            x = data.timestamp(self.col_names[1])
+        else:
+            x = data.get(self.col_names[0], float("nan"))
+
+        self.buffer.append(now, [x] + [data.get(name, float("nan")) for name in self.col_names[1:]])
+
+        # --- rolling window (TIME BASED) ---
+        if self.keep_all or self.max_seconds == 0:
+            self.disp_start = self.buffer.first
+        else:
+            self.disp_start = self.buffer.window_start(now - self.max_seconds)
+
+        if now - self.last_plot > 1/self.plot_rate:
+            self.last_plot = now
+            self._draw_plot()
+
+    def _draw_plot(self):
+        start = self.disp_start
+        left, right = self.pad_x, self.width - self.pad_x
+        top, bottom = self.pad_top, self.height - self.pad_bottom
+        if right - left < 10 or bottom - top < 10:
+            return
+
+        x_range = self.buffer.extrema(self.X, start)
+        if x_range is None:
+            return
+        x0, x1 = x_range
+        if self.col_names[0] == "TIME" and not self.keep_all and self.max_seconds:
+            # Fixed time span so the trace scrolls at constant speed
+            x0 = x1 - self.max_seconds
+        sx = (right - left) / (x1 - x0) if x1 > x0 else 0.0
+
+        x = self.buffer.column(self.X, start)
+        n_pixels = int(right - left)
+
+        for i, name in enumerate(self.col_names[1:]):
+            item = self.line_items[name]
+            y_range = self.buffer.extrema(name, start)
+            if y_range is None:
+                self.canvas.coords(item, 0, 0, 0, 0)
+                continue
+
+            if self.y_limits[i] is not None:
+                y0, y1 = self.y_limits[i]
+            else:
+                pad = 0.05 * (y_range[1] - y_range[0])
+                y0, y1 = y_range[0] - pad, y_range[1] + pad
+            if y1 <= y0:
+                y0, y1 = y0 - 0.5, y1 + 0.5
+            sy = (bottom - top) / (y1 - y0)
+
+            # Min/max per pixel column, then straight to canvas pixels
+            dx, dy = self.decimators[name].decimate(x, self.buffer.column(name, start), start, n_pixels)
+            valid = ~(np.isnan(dx) | np.isnan(dy))
+            pts = np.empty((int(valid.sum()), 2))
+            pts[:, 0] = left + (dx[valid] - x0) * sx
+            pts[:, 1] = bottom - (np.clip(dy[valid], y0, y1) - y0) * sy
+
+            if len(pts) < 2:
+                self.canvas.coords(item, 0, 0, 0, 0)
+            else:
+                self.canvas.coords(item, pts.ravel().tolist())
+
+            if not self.compact:
+                text = f"{self.y_labels[i]} [{y_range[0]:.2f}, {y_range[1]:.2f}]"
+                if text != self._legend_text.get(name):
+                    self._legend_text[name] = text
+                    self.canvas.itemconfig(self.legend_items[name], text=text)
+
+        if not self.compact:
+            if self.col_names[0] == "TIME":
+                span = f"{x1 - x0:.0f} s"
+            else:
+                span = f"{self.col_names[0]} {x0:.3g} - {x1:.3g}"
+            if span != self._span_text:
+                self._span_text = span
+                self.canvas.itemconfig(self.span_item, text=span)
+
+
 class GCirclePlot(ParentWidget):
-    def __init__(self, parent, title="", col_names=None, max_g=2.0, rings=4, trail_length=100, **kwargs):
+    def __init__(self, parent, title="", col_names=None, max_g=2.0, rings=4, trail_length=100,
+                 refresh_rate=20, **kwargs):
         super().__init__(parent, title=title, col_names=col_names, **kwargs)
+        load_matplotlib()
 
         self.max_g = max_g
         self.rings = rings
         self.trail_length = trail_length
 
-        # Store trail as deque (fast FIFO)
-        self.trail_x = deque(maxlen=trail_length)
-        self.trail_y = deque(maxlen=trail_length)
+        # Trail in a preallocated ring, always a contiguous view
+        self.trail = SeriesRing(["x", "y"], trail_length)
+
+        # Redraw at most refresh_rate times a second, independent of the dashboard framerate
+        self.refresh_rate = refresh_rate
+        self.last_plot = 0
+        self.background = None
 
         # Setup matplotlib figure
         self.fig, self.ax = plt.subplots(figsize=(4, 4))
@@ -596,13 +845,20 @@ class GCirclePlot(ParentWidget):
         # Draw reference lines
         self._draw_reference()
 
-        # Plot objects: point + trail
-        (self.point,) = self.ax.plot(0, 0, "ro")
-        (self.trail_line,) = self.ax.plot([], [], "b-", alpha=0.6)
+        # Plot objects: point + trail (animated: drawn by us over the cached background)
+        (self.point,) = self.ax.plot(0, 0, "ro", animated=True)
+        (self.trail_line,) = self.ax.plot([], [], "b-", alpha=0.6, animated=True)
 
         # Embed into Tkinter
         self.canvas = FigureCanvasTkAgg(self.fig, master=self)
         self.canvas.get_tk_widget().pack(fill="both", expand=True)
+        self.canvas.mpl_connect("draw_event", self._on_draw)
+
+    def _on_draw(self, event):
+        """Full redraw (first show, resize): cache circles/axes as the blit background."""
+        self.background = self.canvas.copy_from_bbox(self.fig.bbox)
+        self.ax.draw_artist(self.trail_line)
+        self.ax.draw_artist(self.point)
 
     def _draw_reference(self):
         """Draw concentric circles + cross lines"""
@@ -620,6 +876,7 @@ class GCirclePlot(ParentWidget):
     def _on_resize(self, event):
         size = min(self.winfo_width(), self.winfo_height())
         self.config(width=size, height=size)
+        self.background = None  # stale until the resize redraw
 
     def update_data(self, data):
         if self.col_names[0] not in data or self.col_names[1] not in data:
@@ -628,14 +885,26 @@ class GCirclePlot(ParentWidget):
         x = data[self.col_names[0]]
         y = data[self.col_names[1]]
         # Add new point to buffer
-        self.trail_x.append(x)
-        self.trail_y.append(y)
+        now = time.monotonic()
+        self.trail.append(now, [x, y])
+
+        if now - self.last_plot < 1/self.refresh_rate:
+            return
+        self.last_plot = now
 
         # Update trail and point
+        start = self.trail.first
         self.point.set_data([x], [y])
-        self.trail_line.set_data(self.trail_x, self.trail_y)
+        self.trail_line.set_data(self.trail.column("x", start).copy(), self.trail.column("y", start).copy())
 
-        self.canvas.draw_idle()
+        if self.background is None:
+            self.canvas.draw()
+            return
+
+        self.canvas.restore_region(self.background)
+        self.ax.draw_artist(self.trail_line)
+        self.ax.draw_artist(self.point)
+        self.canvas.blit(self.fig.bbox)
 
 
 class VerticalBar(ParentWidget):
@@ -0,0 +1,46 @@
+import queue
+import threading
+
+# ==============================
+# Ingest -> GUI hand-off
+# ==============================
+
+class LatestMailbox:
+    """
+    Single-slot, latest-wins mailbox. Ingest threads put(), the GUI take()s
+    at most once per frame. Memory is constant no matter how far the GUI
+    falls behind; values replaced before the GUI saw them are counted.
+    """
+    _EMPTY = object()
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._value = self._EMPTY
+        self.posted = 0
+        self.overwritten = 0
+
+    def put(self, value):
+        with self._lock:
+            if self._value is not self._EMPTY:
+                self.overwritten += 1
+            self._value = value
+            self.posted += 1
+
+    def take(self, default=None):
+        with self._lock:
+            value, self._value = self._value, self._EMPTY
+        return default if value is self._EMPTY else value
+
+
+class BoundedMessageQueue(queue.Queue):
+    """Small queue for log/status messages, put() never blocks: drops and counts when full."""
+
+    def __init__(self, maxsize=256):
+        super().__init__(maxsize)
+        self.dropped = 0
+
+    def put(self, item, block=False, timeout=None):
+        try:
+            super().put(item, block=False)
+        except queue.Full:
+            self.dropped += 1
@@ -0,0 +1,68 @@
+import builtins
+import sys
+import threading
+import time
+from collections import defaultdict
+
+# ==============================
+# Startup / import time report
+# ==============================
+# Enabled with --import-report: wraps __import__ before the app's own imports
+# run and prints the slowest modules plus startup milestones (imports done,
+# window shown, layout built). Main thread only.
+# For the full tree: python -X importtime JvS_Data_Acquisition.py
+
+class ImportTimer:
+    def __init__(self):
+        self.enabled = False
+        self.t0 = time.perf_counter()
+        self.cumulative = {}
+        self.self_time = defaultdict(float)
+        self.milestones = []
+
+        self._stack = []
+        self._thread = threading.get_ident()
+        self._real_import = builtins.__import__
+
+    def start(self):
+        self.enabled = True
+        builtins.__import__ = self._timed_import
+
+    def stop(self):
+        builtins.__import__ = self._real_import
+
+    def _timed_import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        if level or name in sys.modules or threading.get_ident() != self._thread:
+            return self._real_import(name, globals, locals, fromlist, level)
+
+        start = time.perf_counter()
+        self._stack.append(0.0)
+        try:
+            return self._real_import(name, globals, locals, fromlist, level)
+        finally:
+            elapsed = time.perf_counter() - start
+            children = self._stack.pop()
+            self.self_time[name] += elapsed - children
+            self.cumulative.setdefault(name, elapsed)
+            if self._stack:
+                self._stack[-1] += elapsed
+
+    def milestone(self, label):
+        if self.enabled:
+            self.milestones.append((label, time.perf_counter() - self.t0))
+
+    def report(self, n=15):
+        if not self.enabled:
+            return
+        self.stop()
+
+        print("\n--- Startup report ---")
+        for label, t in self.milestones:
+            print(f"{t * 1000:8.0f} ms  {label}")
+
+        print(f"\nSlowest imports (cumulative / self ms):")
+        for name, total in sorted(self.cumulative.items(), key=lambda kv: kv[1], reverse=True)[:n]:
+            print(f"{total * 1000:8.1f} {self.self_time[name] * 1000:8.1f}  {name}")
+
+
+import_timer = ImportTimer()
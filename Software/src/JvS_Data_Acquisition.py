@@ -1,20 +1,37 @@
+import sys
+from Import_Timer import import_timer
+if "--import-report" in sys.argv:
+    import_timer.start()
+
 import tkinter as tk
 from tkinter import ttk
 import tkinter.font as tkFont
 import queue
-from tkinter import filedialog
+from tkinter import filedialog, messagebox
 import math
 import time
 import webbrowser
+import multiprocessing
+import argparse
+import os
+import socket
 
 from Device_Manager import *
 from GUI_Widgets import *
 from ConfigManager import *
-from FileEditor import *
 from LayoutBuilder import *
-from Binary2CSV import *
-from Download import *
-from Calibration_Helpers import *
+from Sampling_Profiler import *
+from Render_Budget import *
+from Frame_Scheduler import *
+from Dashboard_Window import *
+# Download, Binary2CSV, Calibration_Helpers and FileEditor (pandas, requests)
+# are imported by the menu actions that use them
+
+import_timer.milestone("imports done")
+
+GUI_FRAME_SECONDS = metrics.gauge("jvs_gui_frame_seconds", "Duration of the last dashboard frame")
+GUI_FPS = metrics.gauge("jvs_gui_fps", "Achieved dashboard frame rate")
+GUI_DROPPED_FRAMES = metrics.gauge("jvs_gui_dropped_frames", "Dashboard frames missed since start")
 
 # ======================================================
 # GUI (View Only)
@@ -30,16 +47,33 @@ class TelemetryDashboard:
         root.geometry("1400x900")
         root.minsize(1200, 800)
 
+        self.profiler = SamplingProfiler()
         self.build_top_menu()
 
-        self.layout_manager = LayoutManager(root, widget_registry)
+        # Window comes up first, widgets are built in the GUI loop
+        self.layout_manager = LayoutManager(root, widget_registry, max_cached=self.config.main.layout_cache_size)
         self.layout_file = self.config.main.layout_file
-        self.layout_manager.load_layout(self.layout_file)
-        self.gui_elements = self.layout_manager.get_widgets()
+        self.gui_elements = []
+
+        # Every window has its own layout, rate and render budget (windows[0] = main)
+        self.main_window = DashboardWindow(root, "main", self.layout_manager, controller.signals,
+                                           self.config.main.framerate)
+        self.render_budget = self.main_window.render_budget
+        self.windows = [self.main_window]
+        self.layout_manager.load_layout_async(self.layout_file, on_done=self._layout_built)
+        self.root.after(0, lambda: import_timer.milestone("window shown"))
+        self.overlay = None
+        if self.overlay_var.get():
+            self.toggle_overlay()
         
         # Start queue processing loop
+        self.scheduler = FrameScheduler(self.config.main.framerate)
+        GUI_FPS.fn = self.scheduler.fps
+        GUI_DROPPED_FRAMES.fn = lambda: self.scheduler.dropped
         self.root.after(100, self.process_gui_queue)
-        self.last_update = time.monotonic()
+
+        for path in self.config.main.extra_windows:
+            self.open_window(path)
 
     def build_top_menu(self):
         self.menu_font = tkFont.Font(size=self.config.main.font_size)
@@ -54,11 +88,14 @@ class TelemetryDashboard:
         file_menu.add_command(label="Edit Layout", command=self.editLayout)
         file_menu.add_command(label="Reload Layout", command=self.reload_layout)
         file_menu.add_command(label="Open Layout", command=self.open_layout)
-        file_menu.add_command(label="Open 2nd Window - Buggy", command=self.open_2nd_window)
+        file_menu.add_command(label="Open Window", command=self.open_window)
         file_menu.add_command(label="Open Command Page", command=self.open_cmd_page)
         file_menu.add_command(label="Vehicle Config", command=self.open_config_edit_page)
         file_menu.add_command(label="Information and Stats", command=self.open_information_page)
         file_menu.add_command(label="ADC Calibrations", command=self.open_adc_calibrations_page)
+        file_menu.add_command(label=f"Profile CPU ({self.config.main.profile_seconds}s)", command=self.start_profile)
+        self.overlay_var = tk.BooleanVar(value=self.config.main.render_overlay)
+        file_menu.add_checkbutton(label="Render Time Overlay", variable=self.overlay_var, command=self.toggle_overlay)
         file_menu.add_separator()
         file_menu.add_command(label="Exit", command=root.quit)
 
@@ -67,17 +104,64 @@ class TelemetryDashboard:
         # Logging Menu
         log_menu = tk.Menu(self.menubar, tearoff=0)
         log_menu.config(font=self.menu_font)
-        log_menu.add_command(label="Start Local Log", command=self.temp)
-        log_menu.add_command(label="Stop Local Log", command=self.temp)
+        log_menu.add_command(label="Start Local Log", command=self.controller.start_logging)
+        log_menu.add_command(label="Stop Local Log", command=self.controller.stop_logging)
         log_menu.add_command(label="Browse Logs", command=self.open_download_page)
         log_menu.add_command(label="Decode Binary", command=self.decode_binary)
         log_menu.add_command(label="Normalize Log", command=self.decode_csv)
         log_menu.add_command(label="View Log", command=self.temp)
+        log_menu.add_separator()
+        log_menu.add_command(label="Start Packet Capture", command=self.controller.start_capture)
+        log_menu.add_command(label="Stop Packet Capture", command=self.controller.stop_capture)
 
         self.menubar.add_cascade(label="Logging", menu=log_menu)
 
         self.root.config(menu=self.menubar)
 
+    def toggle_overlay(self):
+        if not self.overlay_var.get():
+            if self.overlay:
+                self.overlay.destroy()
+                self.overlay = None
+            return
+        if self.overlay:
+            return
+
+        label = self.overlay = tk.Label(
+            self.root,
+            font=("Courier", 10),
+            justify="left",
+            anchor="nw",
+            bg="black",
+            fg="lime"
+        )
+        self.overlay.place(relx=1.0, rely=0.0, anchor="ne")
+
+        # Each chain stops once its own label is gone, even if the overlay
+        # was switched off and on again within the second
+        def refresh():
+            if label is not self.overlay:
+                return
+            label.config(text="\n".join(self.render_budget.stats_lines(5)))
+            label.lift()
+            self.root.after(1000, refresh)
+
+        refresh()
+
+    def start_profile(self, seconds=None):
+        seconds = seconds or self.config.main.profile_seconds
+        if not self.profiler.start(seconds):
+            return
+
+        # Profiler thread can't touch Tk, poll for the result instead
+        def check_done():
+            if self.profiler.running:
+                self.root.after(500, check_done)
+            elif self.profiler.result_paths:
+                messagebox.showinfo("Profile finished", "\n".join(self.profiler.result_paths))
+
+        self.root.after(500, check_done)
+
     def temp(self):
         print("not implemented yet")
         return 
@@ -85,32 +169,76 @@ class TelemetryDashboard:
     def open_layout(self):
         file_path = filedialog.askopenfilename(title="Select a file")
         print(f"Selected: {file_path}")
+        if not file_path:
+            return
+        # Switch (cached layouts are just shown again), "Reload Layout" rebuilds from disk
         self.layout_file = file_path
-        self.reload_layout()
+        self.layout_manager.load_layout(self.layout_file)
+        self.gui_elements = self.layout_manager.get_widgets()
+        self.set_gui_elements(self.gui_elements)
         return
 
     def reload_layout(self):
         self.layout_manager.clear_layout()
         self.layout_manager.load_layout(self.layout_file)
         self.gui_elements = self.layout_manager.get_widgets()
+        self.set_gui_elements(self.gui_elements)
         return
     
-    def open_2nd_window(self):
-        new_window = tk.Toplevel(root)
-        new_window.title("JvS Data Aquisition App")
+    def open_window(self, layout_path=None, framerate=None):
+        """Another dashboard window (e.g. second monitor) fed from the same data pump."""
+        if layout_path is None:
+            layout_path = filedialog.askopenfilename(title="Select a layout", filetypes=[("Layout", "*.json")])
+            if not layout_path:
+                return
+        framerate = framerate or self.config.main.extra_window_framerate
+
+        new_window = tk.Toplevel(self.root)
+        new_window.title(f"JvS Data Aquisition App - {os.path.basename(layout_path)}")
         new_window.geometry("1400x900")
 
+        layout_manager = LayoutManager(new_window, widget_registry, max_cached=1)
+        window = DashboardWindow(new_window, os.path.basename(layout_path), layout_manager,
+                                 self.controller.signals, framerate)
+        self.windows.append(window)
 
-        layout_manager = LayoutManager(new_window, widget_registry)
-        layout_manager.load_layout("layout.json")
-        self.gui_elements.extend(layout_manager.get_widgets())
-        return
+        self.update_pump_rate()
+
+        def close():
+            self.windows.remove(window)
+            self.update_pump_rate()
+            layout_manager.clear_layout()
+            new_window.destroy()
+
+        new_window.protocol("WM_DELETE_WINDOW", close)
+        layout_manager.load_layout_async(layout_path,
+                                         on_done=lambda: window.set_widgets(layout_manager.get_widgets()))
+        return window
+
+    def update_pump_rate(self):
+        """The pump ticks at the fastest open window's rate."""
+        framerate = max(w.framerate for w in self.windows)
+        if framerate != self.scheduler.framerate:
+            self.scheduler.set_framerate(framerate)
+
+    def _layout_built(self):
+        self.gui_elements = self.layout_manager.get_widgets()
+        self.set_gui_elements(self.gui_elements)
+        import_timer.milestone("layout built")
+        import_timer.report()
+
+        self.layout_manager.prebuild(self.config.main.prebuild_layouts)
+
+    def set_gui_elements(self, widgets):
+        """New widget set for the main window."""
+        self.main_window.set_widgets(widgets)
 
     def editConfig(self):
         new_window = tk.Toplevel(root)
         new_window.title("Config Editor")
         new_window.geometry("800x600")
 
+        from FileEditor import FileEditor
         editor = FileEditor(new_window)
         editor.open_file("config.json")
         return
@@ -120,6 +248,7 @@ class TelemetryDashboard:
         new_window.title("Layout Editor")
         new_window.geometry("800x600")
 
+        from FileEditor import FileEditor
         editor = FileEditor(new_window)
         editor.open_file("layout.json")
         return
@@ -142,6 +271,7 @@ class TelemetryDashboard:
         else:
             print("No file selected.")
 
+        from Binary2CSV import bin_to_csv
         bin_to_csv(file_path, False)
     
     def decode_csv(self):
@@ -162,6 +292,7 @@ class TelemetryDashboard:
         else:
             print("No file selected.")
 
+        from Binary2CSV import load_csv, normalize_log
         df = load_csv(file_path)
 
         normalized_filename = file_path.replace('.csv', '_Normalized.csv')
@@ -190,6 +321,7 @@ class TelemetryDashboard:
 
         self.controller.send_cmd_async(en_name, en_cmd)
         cwd = os.getcwd()
+        from Download import LogDownloader
         LogDownloader(new_window, self.config.main.vehicle_ip, cwd + "\\logs")
 
         def close_window():
@@ -216,6 +348,8 @@ class TelemetryDashboard:
             return
 
         self.controller.send_cmd_async(en_name, en_cmd)
+        from Download import FileServerClient
+        from FileEditor import FileEditor
         fileServer = FileServerClient(config.main.vehicle_ip)
 
         status_var = tk.StringVar(value="Ready")
@@ -335,9 +469,62 @@ class TelemetryDashboard:
             text=f"Widget Framerate: {self.config.main.framerate}", 
             font=font
         ).pack()
+
+        # Live stats, refreshed while the page is open
+        stats_var = tk.StringVar()
+        ttk.Label(
+            new_window,
+            textvariable=stats_var,
+            font=("Courier", self.config.main.font_size - 4),
+            justify="left"
+        ).pack(pady=10)
+
+        def refresh_stats():
+            if not new_window.winfo_exists():
+                return
+            stats_var.set("\n".join(self.stats_lines()))
+            new_window.after(1000, refresh_stats)
+
+        refresh_stats()
         return
+
+    def stats_lines(self):
+        lines = []
+
+        lines.append(
+            f"Packets: UDP {PACKETS_UDP.value}  LoRa {PACKETS_LORA.value}  "
+            f"decode errors {DECODE_ERRORS_UDP.value + DECODE_ERRORS_LORA.value}  "
+            f"unknown IDs {UNKNOWN_IDS.value}"
+        )
+        lines.append(f"GUI frame: {GUI_FRAME_SECONDS.value * 1000:.1f} ms (all windows)")
+        lines.extend(self.scheduler.stats_lines())
+        mailbox = self.controller.telem_mailbox
+        lines.append(
+            f"GUI queue: {self.controller.gui_queue.qsize()}/{self.controller.gui_queue.maxsize} "
+            f"dropped {getattr(self.controller.gui_queue, 'dropped', 0)}, "
+            f"telemetry overwritten {mailbox.overwritten}/{mailbox.posted}"
+        )
+        lines.extend(self.controller.tracer.stats_lines())
+        lines.extend(self.controller.logger.stats_lines())
+        for window in self.windows:
+            lines.extend(window.stats_lines())
+
+        capture = self.controller.capture
+        if capture:
+            lines.append(f"Capturing: {capture.path} ({capture.packets} packets, {capture.bytes // 1024} KiB)")
+
+        if self.controller.relay:
+            relay = self.controller.relay
+            filtered = f", {relay.filtered} command datagrams not relayed" if relay.mode == "raw" else ""
+            lines.append(f"UDP Relay ({relay.mode}{filtered}):")
+            for t in relay.stats():
+                lines.append(f"  {t['target']:<22} sent {t['sent']:>8}  dropped {t['dropped']:>6}")
+
+        return lines
     
     def open_adc_calibrations_page(self):
+        from Calibration_Helpers import gen_lin_adc_constants
+
         new_window = tk.Toplevel(root)
         new_window.title("Calibration Page")
         new_window.geometry("800x600")
@@ -464,9 +651,9 @@ class TelemetryDashboard:
     # Queue consumer (thread-safe)
     # ------------------------------
     def process_gui_queue(self):
-        latest_telem = None
+        # Bounded drain so a burst of messages can't eat the frame
         try:
-            while True:
+            for _ in range(self.scheduler.max_queue_items):
                 kind, payload = self.controller.gui_queue.get_nowait()
                 
                 if kind == "log":
@@ -476,24 +663,38 @@ class TelemetryDashboard:
                 elif kind == "status":
                     print("!!! Check - GUI Status")
                     #self.status_label.config(text=payload)
-                elif kind == "telem_data":
-                    # keep only the newest telem row
-                    latest_telem = payload
-                    
+
         except queue.Empty:
             pass
-        
-        self.update(self.controller.signals.get_latest_telem())
+
+        # One snapshot per tick (taken only if some window renders), each
+        # window decides from its own rate / visibility / changed signals.
+        # take_changed() goes through the latest-wins telemetry mailbox.
+        changed = self.controller.signals.take_changed()
+        now = time.monotonic()
+        snapshot = None
+
+        def get_snapshot():
+            nonlocal snapshot
+            if snapshot is None:
+                snapshot = self.controller.signals.get_latest_telem()
+            return snapshot
+
+        start = time.perf_counter()
+        rendered = False
+        for window in self.windows:
+            rendered |= window.tick(now, changed, get_snapshot, self.scheduler.idle_refresh)
+
+        if rendered:
+            GUI_FRAME_SECONDS.set(time.perf_counter() - start)
+            self.scheduler.frame_rendered()
+            self.controller.tracer.frame_rendered()
+        else:
+            self.scheduler.frame_skipped()
     
-        # reschedule
+        # reschedule on a fixed cadence
         if self.controller.running:
-            delay = int(1000/self.config.main.framerate)
-            self.root.after(delay, self.process_gui_queue)
-
-    # ------------------------------
-    def update(self, row: dict):
-        for elmt in self.gui_elements:
-            elmt.update_data(row)
+            self.root.after(self.scheduler.next_delay_ms(), self.process_gui_queue)
 
     # ------------------------------
     # Optional demo generator
@@ -664,8 +865,17 @@ class CommandMenu(tk.LabelFrame):
 # MAIN APP
 # ======================================================
 if __name__ == "__main__":
+    multiprocessing.freeze_support()  # Web fan-out workers in the PyInstaller build
+
+    parser = argparse.ArgumentParser(description="JvS Data Acquisition")
+    parser.add_argument("--profile", type=float, metavar="SECONDS",
+                        help="sample all threads for SECONDS after startup, write to profiles/")
+    parser.add_argument("--import-report", action="store_true",
+                        help="print import times and startup milestones once the layout is built")
+    args = parser.parse_args()
+
     root = tk.Tk()
-    gui_queue = queue.Queue()
+    gui_queue = BoundedMessageQueue(maxsize=256)
     config_manager = ConfigManager("config.json")
     config = config_manager.config
     controller = TelemetryController(gui_queue, root, config)
@@ -673,6 +883,8 @@ if __name__ == "__main__":
 
     # Start listeners (UDP/TCP)
     controller.start_listeners()
+    if args.profile:
+        dashboard.start_profile(args.profile)
     if (False):
         dashboard.demo_update()
         #dashboard.demo_update_time()
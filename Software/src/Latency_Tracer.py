@@ -0,0 +1,128 @@
+import time
+from bisect import bisect_left
+
+# ==============================
+# Ingest latency tracing
+# ==============================
+# Every stage is measured from the moment the packet left the socket / serial
+# port (time.perf_counter()), so the numbers answer "how old is this value by
+# the time it reaches stage X". Recording is a bisect + two adds, no locks:
+# a lost increment under thread contention only blurs a histogram bucket.
+
+class LatencyHistogram:
+    def __init__(self, min_s=1e-5, max_s=100.0, per_octave=4, window=60.0):
+        self.bounds = []
+        b = min_s
+        while b < max_s:
+            self.bounds.append(b)
+            b *= 2 ** (1 / per_octave)
+        self.bounds.append(max_s)
+
+        self.window = window
+        self.window_start = time.monotonic()
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.prev_counts = [0] * (len(self.bounds) + 1)
+
+        # Cumulative, never reset (Prometheus summary _sum/_count)
+        self.total = 0.0
+        self.count = 0
+        self.max = 0.0
+
+    def record(self, seconds: float):
+        self.counts[bisect_left(self.bounds, seconds)] += 1
+        self.total += seconds
+        self.count += 1
+        if seconds > self.max:
+            self.max = seconds
+
+    def _rotate(self):
+        now = time.monotonic()
+        if now - self.window_start >= self.window:
+            self.prev_counts = self.counts
+            self.counts = [0] * (len(self.bounds) + 1)
+            self.window_start = now
+
+    def percentile(self, p: float):
+        """Upper bucket bound of the p-th percentile over the last one to two windows."""
+        self._rotate()
+        counts = [a + b for a, b in zip(self.counts, self.prev_counts)]
+        n = sum(counts)
+        if n == 0:
+            return None
+
+        target = p / 100 * n
+        seen = 0
+        for i, c in enumerate(counts):
+            seen += c
+            if seen >= target:
+                return min(self.bounds[min(i, len(self.bounds) - 1)], self.max)
+        return self.max
+
+
+class LatencyTracer:
+    STAGES = ("decode", "store", "render", "websocket")
+
+    def __init__(self):
+        self.hist = {stage: LatencyHistogram() for stage in self.STAGES}
+
+        # rx time of the newest packet that made it into the SignalStore
+        self.last_rx = None
+        self._rendered_rx = None
+        self._sent_rx = None
+
+    @staticmethod
+    def now():
+        return time.perf_counter()
+
+    def record(self, stage: str, rx_ts: float):
+        self.hist[stage].record(time.perf_counter() - rx_ts)
+
+    def packet_stored(self, rx_ts: float):
+        self.record("store", rx_ts)
+        self.last_rx = rx_ts
+
+    # The consumers below only count a packet the first time it is shown
+    def frame_rendered(self):
+        rx = self.last_rx
+        if rx is not None and rx != self._rendered_rx:
+            self._rendered_rx = rx
+            self.record("render", rx)
+
+    def frame_sent(self):
+        rx = self.last_rx
+        if rx is not None and rx != self._sent_rx:
+            self._sent_rx = rx
+            self.record("websocket", rx)
+
+    # ------------------------------
+    # Reporting
+    # ------------------------------
+    def summary(self):
+        """[(stage, count, p50_s, p99_s, max_s)]"""
+        return [
+            (stage, h.count, h.percentile(50), h.percentile(99), h.max)
+            for stage, h in self.hist.items()
+        ]
+
+    def stats_lines(self):
+        def ms(v):
+            return "--" if v is None else f"{v * 1000:.2f}"
+
+        lines = ["Latency from receipt (ms):", f"  {'stage':<10} {'p50':>8} {'p99':>8} {'max':>8} {'count':>10}"]
+        for stage, count, p50, p99, worst in self.summary():
+            lines.append(f"  {stage:<10} {ms(p50):>8} {ms(p99):>8} {ms(worst if count else None):>8} {count:>10}")
+        return lines
+
+    def prometheus_lines(self):
+        lines = [
+            "# HELP jvs_latency_seconds Time from packet receipt to pipeline stage",
+            "# TYPE jvs_latency_seconds summary",
+        ]
+        for stage, h in self.hist.items():
+            for q in (50, 99):
+                v = h.percentile(q)
+                if v is not None:
+                    lines.append(f'jvs_latency_seconds{{stage="{stage}",quantile="{q / 100}"}} {v:.6g}')
+            lines.append(f'jvs_latency_seconds_sum{{stage="{stage}"}} {h.total!r}')
+            lines.append(f'jvs_latency_seconds_count{{stage="{stage}"}} {h.count}')
+        return lines
@@ -1,6 +1,13 @@
 import json
 import os
+from collections import OrderedDict
 from GUI_Widgets import *
+from Compositor import *
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
 
 '''
 Layout
@@ -14,52 +21,270 @@ widget_registry = {
     "InfoBox": InfoBox,
     "PlotBox": PlotBox,
     "PlotViewer": PlotViewer,
+    "StripChart": StripChart,
     "GCirclePlot": GCirclePlot,
     "VerticalBar": VerticalBar,
     "HorizontalIndicator": HorizontalIndicator
 }
 
+# ------------------------------
+# Signal bindings
+# ------------------------------
+AXIS_NAMES = ("TIME", "INDEX")
+
+class BindingTable:
+    """
+    Compiled after a layout is built: signal index -> positions of the widgets
+    reading that signal, so a frame only has to visit widgets whose inputs
+    changed instead of every widget in the layout.
+    """
+    def __init__(self, widgets, signals):
+        self.n_widgets = len(widgets)
+        self.by_signal = {}
+        self.unbound = []  # no known signal, only updated on full frames
+
+        for pos, widget in enumerate(widgets):
+            names = [n for n in (getattr(widget, "col_names", None) or []) if n and n not in AXIS_NAMES]
+            if not names:
+                self.unbound.append(pos)
+                continue
+            for name in set(names):
+                self.by_signal.setdefault(signals.signal_index(name), []).append(pos)
+
+    def widgets_for(self, changed):
+        """Positions (layout order) of the widgets bound to any changed signal index."""
+        hit = set()
+        for idx in changed:
+            hit.update(self.by_signal.get(idx, ()))
+        return sorted(hit)
+
+
+class BuiltLayout:
+    """One layout's widget tree, living in its own container frame so it can be hidden."""
+    def __init__(self, key, container):
+        self.key = key
+        self.container = container
+        self.frames = []
+        self.widgets = []
+        self.widget_map = {}
+        self.complete = False
+        self.steps = None  # build generator while (pre)building
+
+    def destroy(self):
+        for widget in self.widgets:
+            # pyplot keeps every figure alive until closed
+            for obj in (widget, getattr(widget, "plot", None)):
+                fig = getattr(obj, "fig", None)
+                if fig is not None:
+                    import matplotlib.pyplot as plt
+                    plt.close(fig)
+
+        if self.container.winfo_exists():
+            self.container.destroy()
+
+
 class LayoutManager:
-    def __init__(self, parent, widget_registry):
+    """
+    Builds layouts from JSON and keeps up to max_cached of them alive but
+    hidden (grid_remove), so switching back to a layout is a grid() call
+    instead of a rebuild. Least recently shown layouts are destroyed first,
+    down to just the visible one when free memory drops below min_free_mb.
+    """
+    def __init__(self, parent, widget_registry, max_cached=3, min_free_mb=300, prebuild_step_ms=20):
         self.parent = parent
         self.registry = widget_registry
+        self.max_cached = max_cached
+        self.min_free_mb = min_free_mb
+        self.prebuild_step_ms = prebuild_step_ms
+
+        self.cache = OrderedDict()  # key -> BuiltLayout, least recently shown first
+        self.active = None
+        self.prebuild_queue = []
+        self._prebuild_job = None
 
         self.widgets = []
         self.widget_map = {}
         self.frames = []
 
-    def load_layout(self, path):
+        parent.grid_rowconfigure(0, weight=1)
+        parent.grid_columnconfigure(0, weight=1)
+
+    @staticmethod
+    def _key(path):
+        return os.path.abspath(path)
+
+    def _read(self, path):
         if not os.path.exists(path):
             raise FileNotFoundError(f"Layout file not found: {path}")
 
         with open(path, "r") as f:
-            data = json.load(f)
+            return json.load(f)
 
-        self._build_from_layout(data)
+    def load_layout(self, path):
+        """Show a layout, from the cache when it was already built."""
+        key = self._key(path)
+        built = self.cache.get(key)
+
+        if built is None:
+            built = self._start_build(key, self._read(path))
+
+        if not built.complete:
+            # Finish now (also if it was part way through a prebuild)
+            for _ in built.steps:
+                pass
+
+        self._show(built)
+
+    def load_layout_async(self, path, on_done=None):
+        """
+        Show the (empty) layout right away and build its widgets one per GUI
+        loop step, so the window is up before heavy widgets exist.
+        """
+        key = self._key(path)
+        built = self.cache.get(key)
+        if built is None:
+            built = self._start_build(key, self._read(path))
+        self._show(built)
+
+        def step():
+            if self.cache.get(key) is not built:
+                return  # cleared or replaced meanwhile
+            next(built.steps, None)
+            if not built.complete:
+                self.parent.after(1, step)
+            elif on_done:
+                on_done()
+
+        self.parent.after(1, step)
+
+    def _show(self, built):
+        key = built.key
+        if self.active is not None and self.active != key:
+            self.cache[self.active].container.grid_remove()
+        built.container.grid(row=0, column=0, sticky="nsew")
+
+        self.cache.move_to_end(key)
+        self.active = key
+        self.widgets = built.widgets
+        self.widget_map = built.widget_map
+        self.frames = built.frames
+
+        self._evict()
 
     def clear_layout(self):
-        # Destroy widgets
-        for widget in self.widgets:
-            if widget.winfo_exists():
-                widget.destroy()
+        """Destroy the visible layout (e.g. to reload it from disk)."""
+        if self.active is not None:
+            self.cache.pop(self.active).destroy()
+            self.active = None
 
-        # Destroy frames
-        for frame in self.frames:
-            if frame.winfo_exists():
-                frame.destroy()
+        self.widgets = []
+        self.widget_map = {}
+        self.frames = []
 
-        self.widgets.clear()
-        self.widget_map.clear()
-        self.frames.clear()
+    # ------------------------------
+    # Background prebuild
+    # ------------------------------
+    def prebuild(self, paths):
+        """
+        Build layouts hidden, one widget per Tk idle step (Tk is single
+        threaded, so "background" means interleaved with the GUI loop).
+        """
+        for path in paths:
+            if os.path.exists(path):
+                self.prebuild_queue.append(path)
+            else:
+                print(f"Prebuild skipped, layout not found: {path}")
+
+        if self._prebuild_job is None:
+            self._prebuild_job = self.parent.after(self.prebuild_step_ms, self._prebuild_step)
+
+    def _prebuild_step(self):
+        self._prebuild_job = None
+
+        while self.prebuild_queue:
+            key = self._key(self.prebuild_queue[0])
+            built = self.cache.get(key)
+
+            if built is None:
+                if len(self.cache) >= self.max_cached or self._memory_tight():
+                    self.prebuild_queue.clear()
+                    return
+                try:
+                    built = self._start_build(key, self._read(key))
+                except (OSError, ValueError) as e:
+                    print(f"Prebuild failed for {key}: {e}")
+                    self.prebuild_queue.pop(0)
+                    continue
+                self.cache.move_to_end(key, last=False)  # prebuilt but never shown: first to go
+
+            if built.complete:
+                self.prebuild_queue.pop(0)
+                continue
+
+            next(built.steps, None)
+            break
+
+        if self.prebuild_queue:
+            self._prebuild_job = self.parent.after(self.prebuild_step_ms, self._prebuild_step)
+
+    # ------------------------------
+    # Cache / eviction
+    # ------------------------------
+    _warned_no_psutil = False
+
+    def _memory_tight(self):
+        if psutil is None:
+            if not LayoutManager._warned_no_psutil:
+                LayoutManager._warned_no_psutil = True
+                print("psutil not installed: layout cache evicts by count only, not on low memory")
+            return False
+        return psutil.virtual_memory().available < self.min_free_mb * 1024 * 1024
+
+    def _evict(self):
+        tight = self._memory_tight()
+        limit = 1 if tight else self.max_cached
+
+        for key in list(self.cache):
+            if len(self.cache) <= limit:
+                break
+            if key == self.active:
+                continue
+            self.cache.pop(key).destroy()
+            print(f"Layout evicted{' (low memory)' if tight else ''}: {os.path.basename(key)}")
+
+    # ------------------------------
+    # Building
+    # ------------------------------
+    def _start_build(self, key, data):
+        container = tk.Frame(self.parent)
+        built = BuiltLayout(key, container)
+        built.steps = self._build_steps(built, data)
+        self.cache[key] = built
+        return built
+
+    def _build_steps(self, built, data):
+        """Generator: builds the layout, yielding after every widget."""
+        renderer = data.get("renderer", "tk")
 
-    def _build_from_layout(self, data):
         for frame_def in data.get("frames", []):
-            frame = self._create_frame(self.parent, frame_def)
+            frame = self._create_frame(built, frame_def)
+            widget_defs = frame_def.get("widgets", [])
 
-            for widget_def in frame_def.get("widgets", []):
-                self._create_widget(frame, widget_def)
+            # "renderer": "composite" draws a frame of simple widgets into one image
+            if frame_def.get("renderer", renderer) == "composite" and widget_defs and \
+                    all(d["type"] in COMPOSITE_CELLS for d in widget_defs):
+                self._create_composite(built, frame, widget_defs)
+                yield
+                continue
 
-    def _create_frame(self, parent, frame_def):
+            for widget_def in widget_defs:
+                self._create_widget(built, frame, widget_def)
+                yield
+
+        built.complete = True
+
+    def _create_frame(self, built, frame_def):
+        parent = built.container
         layout = frame_def.get("layout", {})
 
         row = layout.get("row", 0)
@@ -97,11 +322,11 @@ class LayoutManager:
             sticky=sticky
         )
 
-        self.frames.append(frame)
+        built.frames.append(frame)
 
         return frame
 
-    def _create_widget(self, parent, widget_def):
+    def _create_widget(self, built, parent, widget_def):
 
         widget_type = widget_def["type"]
 
@@ -150,16 +375,30 @@ class LayoutManager:
             sticky=sticky
         )
 
-        self.widgets.append(widget)
+        built.widgets.append(widget)
 
         #
         # Optional lookup by title
         #
         title = properties.get("title")
         if title:
-            self.widget_map[title] = widget
+            built.widget_map[title] = widget
 
         return widget
     
+    def _create_composite(self, built, parent, widget_defs):
+        parent.grid_rowconfigure(0, weight=1)
+        parent.grid_columnconfigure(0, weight=1)
+
+        panel = CompositePanel(parent, widgets=widget_defs)
+        panel.grid(row=0, column=0, sticky="nsew")
+        built.widgets.append(panel)
+
+        for cell in panel.cells:
+            if cell.title:
+                built.widget_map[cell.title] = cell
+
+        return panel
+
     def get_widgets(self):
-        return self.widgets
\ No newline at end of file
+        return list(self.widgets)
\ No newline at end of file
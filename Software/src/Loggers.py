@@ -1,11 +1,255 @@
 import os
 import csv
+import queue
+import struct
+import threading
+import time
 from collections import deque
 from datetime import datetime
 from typing import Optional
 
-class BufferedLogger:
-    def __init__(self, file_path, headers, buffer_size=50, add_timestamp=True):
+import numpy as np
+
+# ==============================
+# Background writer
+# ==============================
+# Loggers fill one buffer while the LogWriter thread writes the previous one
+# (swap buffers), so formatting, write() and fsync() on a slow drive never
+# run on the ingest or GUI thread. If every buffer is still queued when the
+# active one fills, the overflow policy either drops new rows ("drop",
+# counted) or allocates another buffer ("grow", counted).
+
+class LogWriter:
+    """
+    One writer thread per SessionLogger.
+    fsync: "never", "interval" (at most every fsync_interval s per file) or "always" (after every write).
+    Between jobs it also hands off rows that sat in a logger's active buffer
+    longer than its flush_interval and fsyncs writes the interval policy
+    deferred, so a quiet stretch (link lost) still reaches the disk.
+    """
+    IDLE_CHECK = 0.25  # s between stale buffer / deferred fsync checks
+
+    def __init__(self, fsync="interval", fsync_interval=1.0):
+        self.fsync = fsync
+        self.fsync_interval = fsync_interval
+        self.jobs = queue.Queue()
+        self.loggers = []  # open loggers, checked for stale rows
+        self.next_check = 0.0
+
+        self.writes = 0
+        self.fsyncs = 0
+        self.errors = 0
+        self.latencies = deque(maxlen=200)  # seconds per write (+ fsync)
+
+        self.thread = threading.Thread(target=self._run, name="LogWriter", daemon=True)
+        self.thread.start()
+
+    def submit(self, logger, buf, n):
+        """buf None = close the logger's file once everything before it is written."""
+        self.jobs.put(("close" if buf is None else "data", logger, buf, n))
+
+    def submit_header(self, logger, header):
+        """Rewrite the file header in place (new signal names), ordered with the data."""
+        self.jobs.put(("header", logger, header, 0))
+
+    def register(self, logger):
+        self.loggers.append(logger)
+
+    def depth(self):
+        """Buffers waiting for the writer thread."""
+        return self.jobs.qsize()
+
+    def stop(self, timeout=None):
+        self.jobs.put(None)
+        self.thread.join(timeout)
+
+    def _run(self):
+        while True:
+            try:
+                job = self.jobs.get(timeout=self.IDLE_CHECK)
+            except queue.Empty:
+                job = False
+
+            now = time.monotonic()
+            if now >= self.next_check:
+                self.next_check = now + self.IDLE_CHECK
+                self._check_idle(now)
+
+            if job is False:
+                continue
+            if job is None:
+                return
+            kind, logger, buf, n = job
+
+            start = time.perf_counter()
+            try:
+                if kind == "header":
+                    logger._rewrite_header(buf)
+                    continue
+                if kind == "close":
+                    if logger in self.loggers:
+                        self.loggers.remove(logger)
+                    if self.fsync != "never":
+                        self._fsync(logger)
+                    logger._close_file()
+                    continue
+
+                logger._write(buf, n)
+                self.writes += 1
+                logger.unsynced = True
+                if self.fsync == "always" or (
+                        self.fsync == "interval" and time.monotonic() - logger.last_fsync >= self.fsync_interval):
+                    self._fsync(logger)
+            except (OSError, ValueError) as e:
+                self.errors += 1
+                print(f"[LogWriter] {os.path.basename(logger.file_path)}: {e}")
+            finally:
+                if kind == "data":
+                    self.latencies.append(time.perf_counter() - start)
+                    logger._release(buf, n)
+
+    def _check_idle(self, now):
+        for logger in list(self.loggers):
+            try:
+                # Queues a data job, written on the next loop
+                logger.flush_if_stale(now)
+                if (self.fsync == "interval" and logger.unsynced
+                        and now - logger.last_fsync >= self.fsync_interval):
+                    self._fsync(logger)
+            except (OSError, ValueError) as e:
+                self.errors += 1
+                print(f"[LogWriter] {os.path.basename(logger.file_path)}: {e}")
+
+    def _fsync(self, logger):
+        logger.file.flush()
+        os.fsync(logger.file.fileno())
+        logger.last_fsync = time.monotonic()
+        logger.unsynced = False
+        self.fsyncs += 1
+
+
+class _SwapBuffers:
+    """
+    Buffer plumbing shared by the log backends. Rows go into `active`; a full
+    buffer (or one older than flush_interval) is handed to the LogWriter and a
+    free one swapped in. Without a writer, buffers are written inline.
+    `lock` guards active/count: producers and the writer's stale check.
+    """
+
+    def _init_buffers(self, writer, overflow, n_buffers=2, flush_interval=1.0):
+        self.writer = writer
+        self.overflow = overflow
+        self.flush_interval = flush_interval
+
+        self.active = self._new_buffer()
+        self.count = 0  # rows in active
+        self.free = deque(self._new_buffer() for _ in range(n_buffers - 1))
+
+        self.lock = threading.Lock()
+        self.closed = False
+        self.rows_queued = 0   # handed to the writer (under lock)
+        self.rows_written = 0  # written (writer thread only)
+        self.dropped = 0
+        self.grown = 0
+        self.unlogged = 0     # samples of signals that are not columns of this file
+        self.missing = set()  # their names, each reported once
+        self.last_handoff = time.monotonic()
+        self.last_fsync = time.monotonic()
+        self.unsynced = False  # written since the last fsync (writer thread)
+
+        if writer is not None:
+            writer.register(self)
+
+    def log_frame(self, frame, *args):
+        with self.lock:
+            if not self.closed:
+                self._log_frame(frame, *args)
+
+    def flush_if_stale(self, now):
+        """Writer thread: hand off rows older than flush_interval. Never waits for a producer."""
+        if not self.count or now - self.last_handoff < self.flush_interval:
+            return
+        if not self.lock.acquire(blocking=False):
+            return  # a producer is logging, it checks the age itself
+        try:
+            if self.count and not self.closed:
+                self._hand_off()
+        finally:
+            self.lock.release()
+
+    def _count_unlogged(self, frame, columns):
+        """Row formats have fixed columns: count (and report once) signals that are not among them."""
+        extra = frame.keys() - columns
+        if not extra:
+            return
+        self.unlogged += len(extra)
+        new = extra - self.missing
+        if new:
+            self.missing |= new
+            print(f"[SessionLogger] Not logged, not a column of {os.path.basename(self.file_path)}: "
+                  f"{', '.join(sorted(new))} (log_format \"events\" records every signal)")
+
+    def _slot(self):
+        """Index for the next row in `active`, or None if the row is dropped."""
+        if self.count >= self.buffer_size and not self._hand_off():
+            self.dropped += 1
+            return None
+        return self.count
+
+    def _row_added(self):
+        self.count += 1
+        if self.count >= self.buffer_size or time.monotonic() - self.last_handoff >= self.flush_interval:
+            self._hand_off()
+
+    def _hand_off(self, force=False):
+        """Queue the active buffer. False if no buffer is free and overflow == "drop"."""
+        if not self.count:
+            return True
+
+        if self.writer is None:
+            self._write(self.active, self.count)
+            self._release(self.active, self.count)
+            self.active = self.free.popleft()
+        else:
+            if self.free:
+                spare = self.free.popleft()
+            elif self.overflow == "grow" or force:
+                spare = self._new_buffer()
+                self.grown += 1
+            else:
+                return False
+            self.rows_queued += self.count
+            self.writer.submit(self, self.active, self.count)
+            self.active = spare
+
+        self.count = 0
+        self.last_handoff = time.monotonic()
+        return True
+
+    def _release(self, buf, n):
+        self.rows_written += n
+        self.free.append(buf)
+
+    def depth(self):
+        """Rows logged but not yet written."""
+        return self.count + self.rows_queued - self.rows_written
+
+    def flush(self):
+        with self.lock:
+            self._hand_off(force=True)
+
+    def close(self):
+        with self.lock:
+            self.closed = True
+            self._hand_off(force=True)
+        if self.writer is None:
+            self._close_file()
+        else:
+            self.writer.submit(self, None, 0)
+
+
+class BufferedLogger(_SwapBuffers):
+    def __init__(self, file_path, headers, buffer_size=50, add_timestamp=True, writer=None, overflow="drop"):
         self.file_path = file_path
         self.headers = headers.copy()
         self.buffer_size = buffer_size
@@ -13,25 +257,33 @@ class BufferedLogger:
 
         if add_timestamp and "timestamp" not in self.headers:
             self.headers.insert(0, "timestamp")
+        self.columns = set(self.headers)
 
-        self.buffer = deque()
+        self._init_buffers(writer, overflow)
         self._init_file()
 
+    def _new_buffer(self):
+        return []
+
     def _init_file(self):
         file_exists = os.path.exists(self.file_path)
-        self.csv_file = open(self.file_path, "a", newline="")
-        self.writer = csv.DictWriter(self.csv_file, fieldnames=self.headers)
+        self.file = open(self.file_path, "a", newline="")
+        self.csv_writer = csv.DictWriter(self.file, fieldnames=self.headers)
         if not file_exists:
-            self.writer.writeheader()
-            self.csv_file.flush()
+            self.csv_writer.writeheader()
+            self.file.flush()
+
+    def _log_frame(self, frame):
+        if self._slot() is None:
+            return
 
-    def log_frame(self, frame):
         if self.add_timestamp:
             frame_dict = {"timestamp": datetime.now().isoformat()}
         else:
             frame_dict = {}
 
         if isinstance(frame, dict):
+            self._count_unlogged(frame, self.columns)
             for col in self.headers:
                 if col == "timestamp" and self.add_timestamp:
                     continue
@@ -47,26 +299,249 @@ class BufferedLogger:
                     continue
                 frame_dict[col] = frame[i]
 
-        self.buffer.append(frame_dict)
+        self.active.append(frame_dict)
+        self._row_added()
 
-        if len(self.buffer) >= self.buffer_size:
-            self.flush()
+    def _write(self, rows, n):
+        self.csv_writer.writerows(rows)
+        self.file.flush()
 
-    def flush(self):
-        while self.buffer:
-            self.writer.writerow(self.buffer.popleft())
-        self.csv_file.flush()
+    def _release(self, rows, n):
+        rows.clear()
+        super()._release(rows, n)
 
-    def close(self):
-        self.flush()
-        self.csv_file.close()
+    def _close_file(self):
+        self.file.close()
+
+
+# ==============================
+# Binary session log
+# ==============================
+# Same header as the vehicle .bin logs (see Binary2CSV.bin_to_csv):
+#   <I magic, <B version, <B num_signals, then per signal <B id, <B len, name
+# Version 2 records are fixed size: <d wall-clock timestamp (s) followed by
+# one <f per signal in header order, NaN where the frame had no value.
+# Version 3 (EventLogger) pads the header to EVENT_HEADER_SIZE and stores
+# <d timestamp, <B id, <f value events, see EventLogger.
+
+BIN_MAGIC = 0xDEADBEEF
+BIN_VERSION_FRAMES = 2
+BIN_VERSION_EVENTS = 3
+
+
+def bin_header(version, names):
+    if len(names) > 255:
+        raise ValueError(f"Binary log supports 255 signals, got {len(names)}")
+    header = struct.pack("<IBB", BIN_MAGIC, version, len(names))
+    for sid, name in enumerate(names):
+        raw = name.encode("utf-8")[:255]
+        header += struct.pack("<BB", sid, len(raw)) + raw
+    return header
+
+
+class BinaryLogger(_SwapBuffers):
+    """
+    Drop-in for BufferedLogger writing fixed-size binary records. Rows are
+    packed into preallocated NumPy buffers and written in one call per
+    buffer, no per-row formatting or dict building.
+    """
+
+    def __init__(self, file_path, headers, buffer_size=512, writer=None, overflow="drop"):
+        self.file_path = file_path
+        self.headers = [h for h in headers if h != "timestamp"]
+        self.columns = set(self.headers)
+        self.buffer_size = buffer_size
+        self.dtype = np.dtype([("timestamp", "<f8"), ("values", "<f4", (len(self.headers),))])
+
+        self.file = open(self.file_path, "wb")
+        self.file.write(bin_header(BIN_VERSION_FRAMES, self.headers))
+        self.file.flush()
+
+        self._init_buffers(writer, overflow)
+
+    def _new_buffer(self):
+        return np.empty(self.buffer_size, dtype=self.dtype)
+
+    def _log_frame(self, frame, ts=None):
+        """frame: dict-like, dataclass or sequence in header order. ts defaults to time.time()."""
+        i = self._slot()
+        if i is None:
+            return
+
+        nan = float("nan")
+        if hasattr(frame, "get"):
+            self._count_unlogged(frame, self.columns)
+            values = [nan if v is None else v for v in map(frame.get, self.headers)]
+        elif hasattr(frame, "__dataclass_fields__"):
+            values = [getattr(frame, col, nan) for col in self.headers]
+            values = [nan if v is None else v for v in values]
+        else:
+            values = [nan if v is None else v for v in frame]
+
+        self.active["timestamp"][i] = time.time() if ts is None else ts
+        self.active["values"][i] = values
+        self._row_added()
+
+    def _write(self, buf, n):
+        self.file.write(buf[:n].tobytes())
+        self.file.flush()
+
+    def _close_file(self):
+        self.file.close()
+
+
+# ==============================
+# Change-only event log
+# ==============================
+# Fed from SignalStore listeners at ingest time, so every sample is seen,
+# not one row per GUI frame. Only values that differ from the last logged
+# value of that signal are written. Every keyframe_interval s a keyframe
+# repeats the current value of every signal so a reader can seek:
+#   <d ts, <B KEYFRAME_ID, <f n>  followed by n ordinary events.
+# Signals seen for the first time get the next id and the (padded) header
+# is rewritten in place by the writer thread, ahead of their first events.
+
+EVENT_HEADER_SIZE = 16384
+EVENT_DTYPE = np.dtype([("timestamp", "<f8"), ("id", "u1"), ("value", "<f4")])
+KEYFRAME_ID = 0xFF
+
+
+class EventLogger(_SwapBuffers):
+    """(ts, signal_id, value) on change. Thread safe: listeners run on every ingest thread."""
+
+    def __init__(self, file_path, names=(), buffer_size=4096, keyframe_interval=1.0, writer=None, overflow="drop"):
+        self.file_path = file_path
+        self.buffer_size = buffer_size
+        self.keyframe_interval = keyframe_interval
+
+        self.names = []
+        self.ids = {}    # name -> id
+        self.last = []   # last logged value per id
+
+        # Listener timestamps are time.monotonic(), the file stores wall clock
+        self.clock_offset = time.time() - time.monotonic()
+        self.next_keyframe = 0.0
+        self.events = 0
+        self.unchanged = 0
+        self.keyframes = 0
+
+        # unlogged here = samples of signals that did not fit the header.
+        # Also creates self.lock, shared with the writer's stale check
+        self._init_buffers(writer, overflow)
+
+        for name in names:
+            self._add_signal(name)
+
+        self.file = open(self.file_path, "wb")
+        self.file.write(self._header())
+        self.file.flush()
+
+    def _new_buffer(self):
+        return np.empty(self.buffer_size, dtype=EVENT_DTYPE)
+
+    def _header(self):
+        return bin_header(BIN_VERSION_EVENTS, self.names).ljust(EVENT_HEADER_SIZE, b"\0")
+
+    def _add_signal(self, name):
+        """Next free id for name, None if the header is full."""
+        if len(self.names) >= KEYFRAME_ID:
+            return None
+        self.names.append(name)
+        if len(bin_header(BIN_VERSION_EVENTS, self.names)) > EVENT_HEADER_SIZE:
+            self.names.pop()
+            return None
+
+        sid = len(self.names) - 1
+        self.ids[name] = sid
+        self.last.append(None)
+        return sid
+
+    def log_signal(self, name, value, mono_ts):
+        """SignalStore listener: callback(name, value, mono_ts)."""
+        with self.lock:
+            if self.closed:
+                return
+
+            sid = self.ids.get(name)
+            if sid is None:
+                sid = self._add_signal(name)
+                if sid is None:
+                    self.unlogged += 1
+                    return
+                header = self._header()
+                if self.writer is None:
+                    self._rewrite_header(header)
+                else:
+                    self.writer.submit_header(self, header)
+
+            ts = mono_ts + self.clock_offset
+            last = self.last[sid]
+            if value == last or (value != value and last != last):
+                self.unchanged += 1
+            else:
+                self.last[sid] = value
+                self._append(ts, sid, value)
+
+            if mono_ts >= self.next_keyframe:
+                self.next_keyframe = mono_ts + self.keyframe_interval
+                self._keyframe(ts)
+
+    def _append(self, ts, sid, value):
+        i = self._slot()
+        if i is None:
+            return
+        self.active[i] = (ts, sid, value)
+        self.events += 1
+        self._row_added()
+
+    def _keyframe(self, ts):
+        known = [(sid, v) for sid, v in enumerate(self.last) if v is not None]
+        # A keyframe is never split: start a new buffer or skip it if none is free
+        if self.buffer_size - self.count < len(known) + 1 and not self._hand_off():
+            return
+
+        i = self.count
+        rows = self.active[i:i + len(known) + 1]
+        rows[0] = (ts, KEYFRAME_ID, len(known))
+        for row, (sid, v) in enumerate(known, 1):
+            rows[row] = (ts, sid, v)
+        self.count += len(known)
+        self.keyframes += 1
+        self._row_added()
+
+    def _write(self, buf, n):
+        self.file.write(buf[:n].tobytes())
+        self.file.flush()
+
+    def _rewrite_header(self, header):
+        self.file.seek(0)
+        self.file.write(header)
+        self.file.seek(0, os.SEEK_END)
+
+    def _close_file(self):
+        self.file.close()
 
 
 class SessionLogger:
-    
+    """
+    log_format: "events" (EventLogger, fed through log_signal at ingest), or
+    one row per packet through log_telemetry: "bin" (BinaryLogger) or "csv"
+    (BufferedLogger). The .bin formats are read with Binary2CSV.
+    Only "events" captures every signal: the row formats fix their columns
+    to telem_cols at start_session, later signals are counted as unlogged.
+    Files are written by one LogWriter thread, see LogWriter for fsync and
+    _SwapBuffers for the overflow policy ("drop" or "grow").
+    """
 
-    def __init__(self, base_dir="logs"):
+    def __init__(self, base_dir="logs", log_format="events", fsync="interval", fsync_interval=1.0,
+                 overflow="drop", keyframe_interval=1.0):
         self.base_dir = base_dir
+        self.log_format = log_format
+        self.frame_rows = log_format != "events"
+        self.overflow = overflow
+        self.keyframe_interval = keyframe_interval
+        self.lock = threading.Lock()  # frame rows come from the UDP and LoRa threads
+        self.writer = LogWriter(fsync, fsync_interval)
         os.makedirs(base_dir, exist_ok=True)
 
         self.index_file = os.path.join(base_dir, "index.csv")
@@ -74,7 +549,7 @@ class SessionLogger:
 
         self.session_active = False
         self.log_number = self._get_next_log_number()
-        self.telemetry_logger: Optional[BufferedLogger] = None
+        self.telemetry_logger: Optional[BufferedLogger | BinaryLogger | EventLogger] = None
         self.events_logger = None
         self.session_start_time = None
 
@@ -101,21 +576,44 @@ class SessionLogger:
 
         self.session_start_time = datetime.now().isoformat()
 
-        telemetry_file = os.path.join(self.base_dir, f"log{self.log_number}_telemetry.csv")
+        ext = "csv" if self.log_format == "csv" else "bin"
+        telemetry_file = os.path.join(self.base_dir, f"log{self.log_number}_telemetry.{ext}")
         events_file = os.path.join(self.base_dir, f"log{self.log_number}_events.csv")
 
         # Create loggers
-        self.telemetry_logger = BufferedLogger(
-            telemetry_file,
-            headers=telem_cols,
-            buffer_size=50,
-            add_timestamp=True
-        )
+        if self.log_format == "events":
+            self.telemetry_logger = EventLogger(
+                telemetry_file,
+                names=telem_cols,
+                keyframe_interval=self.keyframe_interval,
+                writer=self.writer,
+                overflow=self.overflow
+            )
+        elif self.log_format == "bin":
+            self.telemetry_logger = BinaryLogger(
+                telemetry_file,
+                headers=telem_cols,
+                buffer_size=512,
+                writer=self.writer,
+                overflow=self.overflow
+            )
+        else:
+            self.telemetry_logger = BufferedLogger(
+                telemetry_file,
+                headers=telem_cols,
+                buffer_size=50,
+                add_timestamp=True,
+                writer=self.writer,
+                overflow=self.overflow
+            )
+        # Markers are rare and never dropped
         self.events_logger = BufferedLogger(
             events_file,
             headers=["type", "value"],
             buffer_size=1,
-            add_timestamp=True
+            add_timestamp=True,
+            writer=self.writer,
+            overflow="grow"
         )
 
         # Add entry to index with empty end_time for now
@@ -139,7 +637,9 @@ class SessionLogger:
         assert self.telemetry_logger is not None
         assert self.events_logger is not None
 
-        self.telemetry_logger.close()
+        self.session_active = False
+        with self.lock:
+            self.telemetry_logger.close()
         self.events_logger.close()
         end_time = datetime.now().isoformat()
 
@@ -157,14 +657,54 @@ class SessionLogger:
             writer.writeheader()
             writer.writerows(rows)
 
-        self.session_active = False
         self.log_number += 1
         print(f"[SessionLogger] Stopped log {self.log_number - 1}")
 
+    def close(self, timeout=2.0):
+        """Stop the session and give the writer up to `timeout` s to drain."""
+        self.stop_session()
+        self.writer.stop(timeout)
+
+    def stats(self):
+        telem = self.telemetry_logger
+        latencies = list(self.writer.latencies)
+        return {
+            "queue_depth": self.writer.depth(),
+            "rows_pending": telem.depth() if telem else 0,
+            "dropped": telem.dropped if telem else 0,
+            "grown": telem.grown if telem else 0,
+            "unlogged": telem.unlogged if telem else 0,
+            "write_ms_avg": 1000 * sum(latencies) / len(latencies) if latencies else 0.0,
+            "write_ms_max": 1000 * max(latencies, default=0.0),
+            "events": getattr(telem, "events", 0),
+            "unchanged": getattr(telem, "unchanged", 0),
+            "fsyncs": self.writer.fsyncs,
+            "errors": self.writer.errors,
+        }
+
+    def stats_lines(self):
+        s = self.stats()
+        state = f"log {self.log_number}" if self.session_active else "idle"
+        lines = [
+            f"Logging ({state}, {self.log_format}): queue {s['queue_depth']} buffers / {s['rows_pending']} rows, "
+            f"write {s['write_ms_avg']:.1f} ms avg {s['write_ms_max']:.1f} ms max, "
+            f"dropped {s['dropped']}, grown {s['grown']}, unlogged {s['unlogged']}, fsyncs {s['fsyncs']}, errors {s['errors']}"
+        ]
+        if not self.frame_rows:
+            lines.append(f"  events {s['events']}, unchanged samples skipped {s['unchanged']}")
+        return lines
+
     def log_telemetry(self, frame):
-        if self.session_active:
-            assert self.telemetry_logger is not None
-            self.telemetry_logger.log_frame(frame)
+        if self.session_active and self.frame_rows:
+            with self.lock:
+                if self.session_active:
+                    self.telemetry_logger.log_frame(frame)
+
+    def log_signal(self, name, value, mono_ts):
+        """SignalStore listener, records every ingested sample (events format)."""
+        telem = self.telemetry_logger
+        if self.session_active and not self.frame_rows and telem is not None:
+            telem.log_signal(name, value, mono_ts)
 
     def log_event(self, frame):
         if self.session_active:
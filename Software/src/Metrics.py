@@ -0,0 +1,93 @@
+# ==============================
+# Prometheus-style metrics
+# ==============================
+# Counters/gauges are plain attribute updates (no locks) so they can sit on
+# the ingest and GUI hot paths. Callback gauges are evaluated at scrape time.
+
+def format_value(value):
+    """Integers exactly (large counters must not round), floats with full precision."""
+    if isinstance(value, int):
+        return str(value)
+    value = float(value)
+    if value != value:
+        return "NaN"
+    if value in (float("inf"), float("-inf")):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(value)
+
+
+def _label_str(labels):
+    if not labels:
+        return ""
+    inner = ",".join(f'{k}="{v}"' for k, v in labels.items())
+    return "{" + inner + "}"
+
+
+class Counter:
+    def __init__(self, name, labels=None):
+        self.name = name
+        self.labels = labels or {}
+        self.value = 0
+
+    def inc(self, n=1):
+        self.value += n
+
+
+class Gauge:
+    def __init__(self, name, labels=None, fn=None):
+        self.name = name
+        self.labels = labels or {}
+        self.fn = fn
+        self.value = 0.0
+
+    def set(self, value):
+        self.value = value
+
+    def read(self):
+        if self.fn is None:
+            return self.value
+        try:
+            return self.fn()
+        except Exception:
+            return float("nan")
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self._metrics = {}  # (name, labels) -> Counter/Gauge
+        self._help = {}     # name -> (type, help)
+
+    def _get(self, cls, kind, name, help, labels, **kwargs):
+        key = (name, tuple(sorted((labels or {}).items())))
+        metric = self._metrics.get(key)
+        if metric is None:
+            metric = self._metrics[key] = cls(name, labels, **kwargs)
+            self._help.setdefault(name, (kind, help))
+        return metric
+
+    def counter(self, name, help="", labels=None) -> Counter:
+        return self._get(Counter, "counter", name, help, labels)
+
+    def gauge(self, name, help="", labels=None, fn=None) -> Gauge:
+        """fn: optional callback, evaluated on every scrape"""
+        return self._get(Gauge, "gauge", name, help, labels, fn=fn)
+
+    def prometheus_lines(self):
+        lines = []
+        emitted = set()
+
+        for metric in sorted(self._metrics.values(), key=lambda m: m.name):
+            if metric.name not in emitted:
+                kind, help = self._help[metric.name]
+                lines.append(f"# HELP {metric.name} {help}")
+                lines.append(f"# TYPE {metric.name} {kind}")
+                emitted.add(metric.name)
+
+            value = metric.value if isinstance(metric, Counter) else metric.read()
+            lines.append(f"{metric.name}{_label_str(metric.labels)} {format_value(value)}")
+
+        return lines
+
+
+# Process wide registry
+metrics = MetricsRegistry()
@@ -0,0 +1,186 @@
+import argparse
+import os
+import socket
+import struct
+import sys
+import threading
+import time
+from datetime import datetime
+
+# ==============================
+# Raw packet capture / replay
+# ==============================
+'''
+File layout:
+    header  b"JVSCAP" + version u8 + reserved u8                       (8 bytes)
+    records mono_ts f64 + source u8 + length u16 + payload, repeated
+
+mono_ts is time.monotonic() at receipt, replay only uses the differences.
+'''
+
+CAPTURE_MAGIC = b"JVSCAP"
+CAPTURE_VERSION = 1
+RECORD = struct.Struct("<dBH")
+
+SOURCE_UDP = 0
+SOURCE_LORA = 1
+SOURCE_NAMES = {SOURCE_UDP: "UDP", SOURCE_LORA: "LoRa"}
+
+
+class PacketCapture:
+    def __init__(self, path):
+        self.path = path
+        self.packets = 0
+        self.bytes = 0
+        self._lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.file = open(path, "wb", buffering=1 << 20)
+        self.file.write(CAPTURE_MAGIC + bytes([CAPTURE_VERSION, 0]))
+        print(f"[PacketCapture] Writing {path}")
+
+    @staticmethod
+    def default_path(base_dir="captures"):
+        stamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+        return os.path.join(base_dir, f"capture_{stamp}.jvscap")
+
+    def write(self, source: int, data, mono_ts=None):
+        """Called from the ingest threads, one record per datagram / LoRa frame."""
+        if mono_ts is None:
+            mono_ts = time.monotonic()
+
+        with self._lock:
+            if self.file.closed:
+                return
+            self.file.write(RECORD.pack(mono_ts, source, len(data)))
+            self.file.write(data)
+            self.packets += 1
+            self.bytes += len(data)
+
+    def close(self):
+        with self._lock:
+            self.file.close()
+        print(f"[PacketCapture] Closed {self.path} ({self.packets} packets)")
+
+
+def read_capture(path):
+    """Yields (mono_ts, source, payload)."""
+    with open(path, "rb") as f:
+        header = f.read(8)
+        if header[:6] != CAPTURE_MAGIC:
+            raise ValueError(f"Not a capture file: {path}")
+        if header[6] != CAPTURE_VERSION:
+            raise ValueError(f"Unsupported capture version {header[6]}")
+
+        while True:
+            head = f.read(RECORD.size)
+            if len(head) < RECORD.size:
+                break
+
+            mono_ts, source, length = RECORD.unpack(head)
+            payload = f.read(length)
+            if len(payload) < length:
+                print("!! Truncated capture record")
+                break
+
+            yield mono_ts, source, payload
+
+
+def replay_capture(path, host="127.0.0.1", udp_port=5002, speed=1.0, lora="udp"):
+    """
+    Feed a capture back into a running TelemetryController.
+    speed = 1 real time, N = N x faster, 0 = as fast as possible
+    lora  = "udp" (send LoRa frames to the UDP port too), "pty" or "skip"
+    """
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+
+    pty_master = None
+    if lora == "pty":
+        import pty
+        pty_master, pty_slave = pty.openpty()
+        print(f"LoRa frames on {os.ttyname(pty_slave)}, set lora_com_port to this")
+        input("Press Enter once the dashboard is running...")
+
+    sent = {SOURCE_UDP: 0, SOURCE_LORA: 0}
+    first_ts = None
+    start = time.perf_counter()
+    max_late = 0.0
+
+    for mono_ts, source, payload in read_capture(path):
+        if first_ts is None:
+            first_ts = mono_ts
+
+        if speed > 0:
+            target = start + (mono_ts - first_ts) / speed
+            delay = target - time.perf_counter()
+            if delay > 0.002:
+                time.sleep(delay - 0.001)
+            while time.perf_counter() < target:
+                pass
+            max_late = max(max_late, time.perf_counter() - target)
+
+        if source == SOURCE_LORA and lora == "skip":
+            continue
+
+        if source == SOURCE_LORA and pty_master is not None:
+            # Same framing the RX module puts on the serial line
+            os.write(pty_master, b"D:" + bytes([len(payload)]) + payload)
+        else:
+            sock.sendto(payload, (host, udp_port))
+
+        sent[source] += 1
+
+    elapsed = time.perf_counter() - start
+    total = sent[SOURCE_UDP] + sent[SOURCE_LORA]
+    print(f"Replayed {total} packets (UDP {sent[SOURCE_UDP]}, LoRa {sent[SOURCE_LORA]}) "
+          f"in {elapsed:.2f}s = {total / max(elapsed, 1e-9):.0f} pkt/s, worst lateness {max_late * 1000:.2f} ms")
+    return sent, elapsed
+
+
+def capture_info(path):
+    counts = {SOURCE_UDP: 0, SOURCE_LORA: 0}
+    first_ts = last_ts = None
+    size = 0
+
+    for mono_ts, source, payload in read_capture(path):
+        first_ts = mono_ts if first_ts is None else first_ts
+        last_ts = mono_ts
+        counts[source] = counts.get(source, 0) + 1
+        size += len(payload)
+
+    duration = (last_ts - first_ts) if first_ts is not None else 0.0
+    print(f"{path}: {duration:.1f}s, {size} payload bytes")
+    for source, n in counts.items():
+        print(f"  {SOURCE_NAMES.get(source, source)}: {n} packets ({n / max(duration, 1e-9):.1f}/s)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Replay or inspect JvS packet captures")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+
+    rp = sub.add_parser("replay", help="send a capture to the dashboard")
+    rp.add_argument("file")
+    rp.add_argument("--host", default="127.0.0.1")
+    rp.add_argument("--port", type=int, default=5002, help="udp_port of the dashboard")
+    rp.add_argument("--speed", type=float, default=1.0, help="1 = real time, 4 = 4x")
+    rp.add_argument("--fast", action="store_true", help="as fast as possible")
+    rp.add_argument("--loop", type=int, default=1, help="replay N times")
+    rp.add_argument("--lora", choices=["udp", "pty", "skip"], default="udp")
+
+    ip = sub.add_parser("info", help="summarise a capture")
+    ip.add_argument("file")
+
+    args = parser.parse_args()
+
+    if args.cmd == "info":
+        capture_info(args.file)
+        sys.exit(0)
+
+    for _ in range(args.loop):
+        replay_capture(
+            args.file,
+            host=args.host,
+            udp_port=args.port,
+            speed=0 if args.fast else args.speed,
+            lora=args.lora
+        )
@@ -0,0 +1,80 @@
+import argparse
+import math
+import time
+import tkinter as tk
+
+from GUI_Widgets import *
+
+# ==============================
+# Plot render benchmark
+# ==============================
+# Feeds synthetic telemetry to N plots and forces a redraw every frame, then
+# reports achieved frames per second. Needs a display.
+#
+#   python Render_Benchmark.py
+#   python Render_Benchmark.py --plots 1 4 --frames 300
+
+COLS = ["TIME", "RPM", "CLT1"]
+
+VARIANTS = {
+    "PlotBox (full redraw)": (PlotBox, {"blit": False}),
+    "PlotBox (blit)": (PlotBox, {"blit": True}),
+    "StripChart": (StripChart, {}),
+}
+
+
+def fake_data(t) -> SignalDict:
+    now = time.monotonic()
+    values = {
+        "RPM": 4000 + 3000 * math.sin(t * 0.7),
+        "CLT1": 85 + 5 * math.sin(t * 0.05),
+    }
+    return SignalDict(values, {name: now for name in values})
+
+
+def run(widget_cls, props, n_plots, frames, warmup=30):
+    root = tk.Tk()
+    root.geometry("1400x900")
+
+    cols = math.ceil(math.sqrt(n_plots))
+    for c in range(cols):
+        root.grid_columnconfigure(c, weight=1)
+    for r in range(math.ceil(n_plots / cols)):
+        root.grid_rowconfigure(r, weight=1)
+
+    widgets = []
+    for i in range(n_plots):
+        w = widget_cls(root, title=f"Plot {i}", col_names=COLS, **props)
+        w.grid(row=i // cols, column=i % cols, sticky="nsew")
+        w.plot_rate = 10000  # draw on every update
+        widgets.append(w)
+
+    root.update()
+
+    t = 0.0
+    start = None
+    for frame in range(warmup + frames):
+        if frame == warmup:
+            start = time.perf_counter()
+        t += 0.02
+        data = fake_data(t)
+        for w in widgets:
+            w.last_plot = 0
+            w.update_data(data)
+        root.update()
+
+    fps = frames / (time.perf_counter() - start)
+    root.destroy()
+    return fps
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Plot render benchmark")
+    parser.add_argument("--plots", type=int, nargs="+", default=[1, 4, 8])
+    parser.add_argument("--frames", type=int, default=200)
+    args = parser.parse_args()
+
+    print(f"{'variant':<24}" + "".join(f"{n:>4} plots" for n in args.plots))
+    for name, (cls, props) in VARIANTS.items():
+        results = [run(cls, props, n, args.frames) for n in args.plots]
+        print(f"{name:<24}" + "".join(f"{fps:>6.1f} fps" for fps in results))
@@ -0,0 +1,108 @@
+import time
+from collections import deque
+
+# ==============================
+# Per-widget render budget
+# ==============================
+# Every widget gets an equal share of the frame budget. A widget is throttled
+# (updated every 2nd, 4th, ... frame) only when it is over its share AND the
+# whole frame is over budget for a full window, so a single heavy plot in an
+# otherwise light layout is left alone. A throttled widget that skips a frame
+# stays pending and is visited again next frame, so a partial (only=) frame
+# never loses its change.
+
+class WidgetRenderStats:
+    def __init__(self, widget, window, index):
+        self.widget = widget
+        self.index = index  # position in the widget list
+        title = getattr(widget, "title", "") or ",".join(getattr(widget, "col_names", None) or [])
+        self.name = f"{type(widget).__name__}:{title}"
+        self.durations = deque(maxlen=window)
+        self.divisor = 1
+        self.frame = 0
+
+    def avg(self):
+        return sum(self.durations) / len(self.durations) if self.durations else 0.0
+
+    def worst(self):
+        return max(self.durations) if self.durations else 0.0
+
+
+class RenderBudget:
+    def __init__(self, framerate, budget_fraction=0.8, window=60, max_divisor=8):
+        self.frame_budget = budget_fraction / framerate
+        self.window = window
+        self.max_divisor = max_divisor
+
+        self.stats = []
+        self.widget_budget = self.frame_budget
+        self.frame_times = deque(maxlen=window)
+        self.frames = 0
+        self.pending = set()  # positions skipped by their throttle, not updated yet
+
+    def set_widgets(self, widgets):
+        self.stats = [WidgetRenderStats(w, self.window, i) for i, w in enumerate(widgets)]
+        self.pending = set()
+        self.widget_budget = self.frame_budget / max(len(self.stats), 1)
+        self.frame_times.clear()
+        self.frames = 0
+
+    def run_frame(self, data, only=None):
+        """
+        Update every widget that is due this frame, timing each one.
+        only = positions of the widgets to visit (default: all), widgets
+        still pending from a throttled frame are always added.
+        """
+        perf = time.perf_counter
+        frame_start = perf()
+        if only is None:
+            stats = self.stats
+        else:
+            stats = [self.stats[i] for i in sorted(set(only) | self.pending)]
+        self.pending = set()
+
+        for st in stats:
+            st.frame += 1
+            if st.frame % st.divisor:
+                self.pending.add(st.index)
+                continue
+
+            start = perf()
+            st.widget.update_data(data)
+            # Normalise to per-frame cost so throttled widgets compare fairly
+            st.durations.append((perf() - start) / st.divisor)
+
+        self.frame_times.append(perf() - frame_start)
+        self.frames += 1
+
+        if self.frames % self.window == 0:
+            self._rebalance()
+
+    def _rebalance(self):
+        frame_avg = sum(self.frame_times) / len(self.frame_times)
+        over_frame = frame_avg > self.frame_budget
+
+        for st in self.stats:
+            avg = st.avg()
+            if over_frame and avg > self.widget_budget and st.divisor < self.max_divisor:
+                st.divisor *= 2
+                print(f"⚠ {st.name} over render budget "
+                      f"({avg * 1000:.1f} ms > {self.widget_budget * 1000:.1f} ms), "
+                      f"updating every {st.divisor} frames")
+            elif st.divisor > 1 and not over_frame and avg * 2 < self.widget_budget:
+                st.divisor //= 2
+
+    # ------------------------------
+    # Reporting
+    # ------------------------------
+    def slowest(self, n=None):
+        return sorted(self.stats, key=lambda st: st.avg(), reverse=True)[:n]
+
+    def stats_lines(self, n=None):
+        frame_avg = sum(self.frame_times) / len(self.frame_times) if self.frame_times else 0.0
+        lines = [f"Frame {frame_avg * 1000:.1f} ms / budget {self.frame_budget * 1000:.1f} ms "
+                 f"(widget share {self.widget_budget * 1000:.2f} ms)"]
+        for st in self.slowest(n):
+            throttle = f" 1/{st.divisor}" if st.divisor > 1 else ""
+            lines.append(f"  {st.name[:30]:<30} avg {st.avg() * 1000:6.2f}  max {st.worst() * 1000:6.2f} ms{throttle}")
+        return lines
@@ -0,0 +1,145 @@
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from datetime import datetime
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+# ==============================
+# Sampling profiler
+# ==============================
+# Walks sys._current_frames() every `interval` seconds for a fixed duration,
+# so it sees every Python thread (Tk main loop, LoRa, UDP, asyncio, ...)
+# without tracing overhead. Output:
+#   *_collapsed.txt  "thread;outer;...;inner count" lines for flamegraph.pl / speedscope
+#   *_summary.txt    per-thread samples + CPU time, hottest functions
+
+def _frame_label(frame):
+    code = frame.f_code
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+def _thread_cpu_times():
+    """{native_id: cpu seconds} for every thread we can measure, or {}"""
+    if psutil is not None:
+        try:
+            return {t.id: t.user_time + t.system_time for t in psutil.Process().threads()}
+        except Exception:
+            pass
+
+    if hasattr(time, "pthread_getcpuclockid"):
+        out = {}
+        for t in threading.enumerate():
+            try:
+                clk = time.pthread_getcpuclockid(t.ident)
+                out[t.native_id] = time.clock_gettime(clk)
+            except (OSError, TypeError):
+                pass
+        return out
+
+    return {}
+
+
+class SamplingProfiler:
+    def __init__(self, interval=0.005, out_dir="profiles"):
+        self.interval = interval
+        self.out_dir = out_dir
+        self.running = False
+        self.result_paths = None
+
+    def start(self, duration: float):
+        if self.running:
+            print("Profiler already running")
+            return False
+
+        self.running = True
+        self.result_paths = None
+        threading.Thread(target=self._run, args=(duration,), name="SamplingProfiler", daemon=True).start()
+        print(f"Profiling all threads for {duration:.0f}s...")
+        return True
+
+    def _run(self, duration):
+        try:
+            self.result_paths = self._profile(duration)
+            print(f"Profile written: {self.result_paths[0]}")
+        except OSError as e:
+            print(f"Profile write failed: {e}")
+        except Exception as e:
+            print(f"Profile failed: {e!r}")
+        finally:
+            # Always allow the next profile, whatever went wrong
+            self.running = False
+
+    def _profile(self, duration):
+        me = threading.get_ident()
+        stacks = Counter()
+        thread_samples = Counter()
+        leaf_samples = Counter()
+        samples = 0
+
+        cpu_start = _thread_cpu_times()
+        wall_start = time.perf_counter()
+        end = wall_start + duration
+
+        while time.perf_counter() < end:
+            names = {t.ident: t.name for t in threading.enumerate()}
+
+            for ident, frame in sys._current_frames().items():
+                if ident == me:
+                    continue
+
+                stack = []
+                leaf = frame
+                while frame is not None:
+                    stack.append(_frame_label(frame))
+                    frame = frame.f_back
+
+                thread = names.get(ident, f"thread-{ident}")
+                stack.append(thread)
+                stacks[";".join(reversed(stack))] += 1
+                thread_samples[thread] += 1
+                leaf_samples[_frame_label(leaf)] += 1
+
+            samples += 1
+            time.sleep(self.interval)
+
+        wall = time.perf_counter() - wall_start
+        cpu_end = _thread_cpu_times()
+
+        return self._write(stacks, thread_samples, leaf_samples, samples, wall, cpu_start, cpu_end)
+
+    def _write(self, stacks, thread_samples, leaf_samples, samples, wall, cpu_start, cpu_end):
+        os.makedirs(self.out_dir, exist_ok=True)
+        stamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+        collapsed_path = os.path.join(self.out_dir, f"profile_{stamp}_collapsed.txt")
+        summary_path = os.path.join(self.out_dir, f"profile_{stamp}_summary.txt")
+
+        with open(collapsed_path, "w") as f:
+            for stack, count in stacks.most_common():
+                f.write(f"{stack} {count}\n")
+
+        native_ids = {t.name: t.native_id for t in threading.enumerate()}
+
+        with open(summary_path, "w") as f:
+            f.write(f"{samples} samples over {wall:.1f}s (interval {self.interval * 1000:.1f} ms)\n\n")
+            f.write(f"{'thread':<28} {'samples':>8} {'cpu s':>8} {'cpu %':>7}\n")
+
+            for thread, count in thread_samples.most_common():
+                nid = native_ids.get(thread)
+                if nid in cpu_start and nid in cpu_end:
+                    cpu = cpu_end[nid] - cpu_start[nid]
+                    f.write(f"{thread:<28} {count:>8} {cpu:>8.2f} {cpu / wall * 100:>6.1f}%\n")
+                else:
+                    f.write(f"{thread:<28} {count:>8} {'--':>8} {'--':>7}\n")
+
+            f.write("\nHottest functions (innermost frame, all threads):\n")
+            total = sum(leaf_samples.values()) or 1
+            for label, count in leaf_samples.most_common(20):
+                f.write(f"{count / total * 100:6.1f}%  {label}\n")
+
+        return collapsed_path, summary_path
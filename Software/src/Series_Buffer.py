@@ -0,0 +1,124 @@
+from collections import deque
+
+import numpy as np
+
+# ==============================
+# Fixed-size time series storage for plots
+# ==============================
+# Every sample is written twice, at i and i + capacity, so the newest N
+# samples are always one contiguous slice: windows are NumPy views, never
+# copies, and timestamps stay sorted inside a view for searchsorted.
+
+
+class RunningExtrema:
+    """
+    Min/max over a window that only moves forward (monotonic deques), O(1)
+    amortised per sample. NaN samples are ignored.
+    """
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self._min = deque()  # (index, value), values increasing
+        self._max = deque()  # (index, value), values decreasing
+        self.start = 0
+
+    def push(self, index, value):
+        # Entries that fell out of the ring go even if nobody queries
+        oldest = index - self.capacity
+        while self._min and self._min[0][0] <= oldest:
+            self._min.popleft()
+        while self._max and self._max[0][0] <= oldest:
+            self._max.popleft()
+
+        if value != value:
+            return
+        while self._min and self._min[-1][1] >= value:
+            self._min.pop()
+        self._min.append((index, value))
+        while self._max and self._max[-1][1] <= value:
+            self._max.pop()
+        self._max.append((index, value))
+
+    def reset(self, start, values):
+        """Rebuild for a window starting at index `start` (window grew backwards)."""
+        self._min.clear()
+        self._max.clear()
+        self.start = start
+        for i, v in enumerate(values.tolist(), start):
+            self.push(i, v)
+
+    def get(self, start):
+        """(min, max) of samples with index >= start, or None if there are none."""
+        self.start = start
+        while self._min and self._min[0][0] < start:
+            self._min.popleft()
+        while self._max and self._max[0][0] < start:
+            self._max.popleft()
+        if not self._min:
+            return None
+        return self._min[0][1], self._max[0][1]
+
+
+class SeriesRing:
+    """Timestamps plus named float columns, the newest `capacity` samples are kept."""
+
+    def __init__(self, names, capacity=36000):
+        self.names = list(names)
+        self.index = {name: i for i, name in enumerate(self.names)}
+        self.capacity = capacity
+        self.count = 0  # samples ever appended, absolute index of the next one
+
+        self._ts = np.empty(2 * capacity)
+        self._cols = np.empty((len(self.names), 2 * capacity))
+        self._extrema = [RunningExtrema(capacity) for _ in self.names]
+
+    def __len__(self):
+        return min(self.count, self.capacity)
+
+    @property
+    def first(self):
+        """Absolute index of the oldest sample still stored."""
+        return self.count - len(self)
+
+    def append(self, ts, values):
+        """values: one float (or None) per column, in `names` order."""
+        cap = self.capacity
+        i = self.count % cap
+        self._ts[i] = self._ts[i + cap] = ts
+
+        for k, v in enumerate(values):
+            v = float("nan") if v is None else v
+            self._cols[k, i] = self._cols[k, i + cap] = v
+            self._extrema[k].push(self.count, v)
+
+        self.count += 1
+
+    def _slice(self, start):
+        start = max(start, self.first)
+        begin = start % self.capacity
+        return slice(begin, begin + self.count - start)
+
+    def window_start(self, cutoff):
+        """Absolute index of the first sample with ts >= cutoff."""
+        ts = self._ts[self._slice(self.first)]
+        return self.first + int(np.searchsorted(ts, cutoff, side="left"))
+
+    def timestamps(self, start):
+        return self._ts[self._slice(start)]
+
+    def column(self, name, start):
+        """View (not a copy) of one column from absolute index `start` to now."""
+        return self._cols[self.index[name], self._slice(start)]
+
+    def extrema(self, name, start):
+        """(min, max) of a column from `start` to now, or None if all NaN."""
+        start = max(start, self.first)
+        k = self.index[name]
+        ext = self._extrema[k]
+        if start < ext.start:
+            ext.reset(start, self._cols[k, self._slice(start)])
+        return ext.get(start)
+
+    def clear(self):
+        self.count = 0
+        self._extrema = [RunningExtrema(self.capacity) for _ in self.names]
@@ -0,0 +1,299 @@
+import struct
+import sys
+import threading
+import time
+from multiprocessing import shared_memory
+
+# ==============================
+# Shared-memory signal bus
+# ==============================
+'''
+Fixed layout (little endian, every block 8 byte aligned):
+
+    header      magic u32, version u32, max_signals u32, history_len u32,
+                n_signals u32, reserved u32, seq u64            (32 bytes)
+    names       max_signals * 32 bytes utf-8, NUL padded
+    values      max_signals * f64    latest value
+    stamps      max_signals * f64    latest time.monotonic()
+    counts      max_signals * u64    samples written (ring head = count % history_len)
+    seqs        max_signals * u64    per-signal seqlock
+    hist_vals   max_signals * history_len * f64
+    hist_stamps max_signals * history_len * f64
+
+The writer bumps seq and the signal's seqs entry to odd before touching
+anything and back to even after, readers retry until they see the same even
+number on both sides of their copy. Single-signal reads (latest, history)
+use the signal's own seq, so they only retry when that signal was written
+mid-copy. Copies are one memoryview slice each, the reordering happens after.
+The bus-wide seq is only used by read_latest, which gives up on one instant
+after SNAPSHOT_RETRIES and falls back to per-signal reads.
+Timestamps are time.monotonic(), which is system wide, so a reader can compute
+ages with its own time.monotonic().
+'''
+
+BUS_MAGIC = 0x4253564A  # "JVSB"
+BUS_VERSION = 2
+NAME_LEN = 32
+HEADER_SIZE = 32
+
+
+def _layout(max_signals, history_len):
+    names = HEADER_SIZE
+    values = names + max_signals * NAME_LEN
+    stamps = values + max_signals * 8
+    counts = stamps + max_signals * 8
+    seqs = counts + max_signals * 8
+    hist_vals = seqs + max_signals * 8
+    hist_stamps = hist_vals + max_signals * history_len * 8
+    total = hist_stamps + max_signals * history_len * 8
+    return names, values, stamps, counts, seqs, hist_vals, hist_stamps, total
+
+
+def _attach(name):
+    """Attach without letting this process' resource tracker unlink the block on exit."""
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        # Python < 3.13
+        shm = shared_memory.SharedMemory(name=name)
+        if sys.platform != "win32":
+            from multiprocessing import resource_tracker
+            resource_tracker.unregister(shm._name, "shared_memory")
+        return shm
+
+
+class _BusViews:
+    def _map(self, buf, max_signals, history_len):
+        self.max_signals = max_signals
+        self.history_len = history_len
+
+        names, values, stamps, counts, seqs, hist_vals, hist_stamps, total = _layout(max_signals, history_len)
+
+        self._hdr = buf[0:24].cast("I")
+        self._seq = buf[24:32].cast("Q")
+        self._names = buf[names:values]
+        self._values = buf[values:stamps].cast("d")
+        self._stamps = buf[stamps:counts].cast("d")
+        self._counts = buf[counts:seqs].cast("Q")
+        self._seqs = buf[seqs:hist_vals].cast("Q")
+        self._hist_vals = buf[hist_vals:hist_stamps].cast("d")
+        self._hist_stamps = buf[hist_stamps:total].cast("d")
+
+    def _release(self):
+        for view in (self._hdr, self._seq, self._names, self._values, self._stamps,
+                     self._counts, self._seqs, self._hist_vals, self._hist_stamps):
+            view.release()
+
+
+class SharedSignalBus(_BusViews):
+    """Writer side, lives in the TelemetryController process."""
+
+    def __init__(self, name="jvs_signals", max_signals=256, history_len=1024):
+        self.name = name
+        size = _layout(max_signals, history_len)[-1]
+
+        try:
+            self.shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        except FileExistsError:
+            # Left over from a crashed session, start fresh
+            old = _attach(name)
+            old.close()
+            old.unlink()
+            self.shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+
+        self._map(self.shm.buf, max_signals, history_len)
+        self._hdr[0] = BUS_MAGIC
+        self._hdr[1] = BUS_VERSION
+        self._hdr[2] = max_signals
+        self._hdr[3] = history_len
+        self._hdr[4] = 0
+        self._seq[0] = 0
+
+        self._lock = threading.Lock()
+        self._slots = {}
+        self._full_warned = False
+
+        print(f"Signal bus '{name}' ready ({size // 1024} KiB)")
+
+    def _slot(self, name):
+        slot = self._slots.get(name)
+        if slot is not None:
+            return slot
+
+        slot = len(self._slots)
+        if slot >= self.max_signals:
+            if not self._full_warned:
+                print(f"Signal bus full, ignoring {name}")
+                self._full_warned = True
+            return None
+
+        raw = name.encode("utf-8")[:NAME_LEN]
+        off = slot * NAME_LEN
+        self._names[off:off + NAME_LEN] = raw.ljust(NAME_LEN, b"\0")
+        self._slots[name] = slot
+        self._hdr[4] = slot + 1
+        return slot
+
+    def update(self, name: str, value, ts: float):
+        """SignalStore listener."""
+        try:
+            val = float(value)
+        except (TypeError, ValueError):
+            val = float("nan")
+
+        with self._lock:
+            slot = self._slot(name)
+            self._seq[0] += 1  # odd: write in progress
+
+            if slot is not None:
+                self._seqs[slot] += 1
+                count = self._counts[slot]
+                h = slot * self.history_len + count % self.history_len
+
+                self._hist_vals[h] = val
+                self._hist_stamps[h] = ts
+                self._values[slot] = val
+                self._stamps[slot] = ts
+                self._counts[slot] = count + 1
+                self._seqs[slot] += 1
+
+            self._seq[0] += 1  # even: consistent
+
+    def close(self):
+        self._release()
+        self.shm.close()
+        self.shm.unlink()
+
+
+class SignalBusReader(_BusViews):
+    """
+    Reader side for other processes (web workers, notebooks, scripts).
+
+        bus = SignalBusReader("jvs_signals")
+        bus.latest("RPM")        -> (value, mono_ts)
+        bus.history("OilPres")   -> ([ts...], [values...]) oldest first
+        bus.numpy_views()        -> zero-copy arrays over the shared block
+    """
+
+    SNAPSHOT_RETRIES = 100  # read_latest attempts at one bus-wide instant
+
+    def __init__(self, name="jvs_signals"):
+        self.shm = _attach(name)
+
+        hdr = struct.unpack_from("<IIII", self.shm.buf, 0)
+        if hdr[0] != BUS_MAGIC or hdr[1] != BUS_VERSION:
+            self.shm.close()
+            raise ValueError(f"{name} is not a signal bus (magic {hdr[0]:#x}, version {hdr[1]})")
+
+        self._map(self.shm.buf, hdr[2], hdr[3])
+        self._slots = {}
+
+    def _consistent(self, seq, i, read, retries=None):
+        """read() under seqlock seq[i]. None after `retries` failed attempts (None: retry forever)."""
+        tries = 0
+        while True:
+            start = seq[i]
+            if not start & 1:
+                result = read()
+                if seq[i] == start:
+                    return result
+
+            tries += 1
+            if retries is not None and tries >= retries:
+                return None
+            time.sleep(0)  # let the writer finish
+
+    def _refresh_names(self):
+        n = self._hdr[4]
+        for slot in range(len(self._slots), n):
+            off = slot * NAME_LEN
+            raw = bytes(self._names[off:off + NAME_LEN]).rstrip(b"\0")
+            self._slots[raw.decode("utf-8", errors="replace")] = slot
+
+    def names(self):
+        self._refresh_names()
+        return list(self._slots)
+
+    def latest(self, name):
+        self._refresh_names()
+        slot = self._slots.get(name)
+        if slot is None:
+            return None
+        return self._latest(slot)
+
+    def _latest(self, slot):
+        return self._consistent(self._seqs, slot, lambda: (self._values[slot], self._stamps[slot]))
+
+    def read_latest(self) -> dict:
+        """
+        {name: (value, mono_ts)} for every signal, from one consistent instant
+        if the writer lets us, else each signal consistent on its own.
+        """
+        self._refresh_names()
+        slots = list(self._slots.items())
+        n = len(slots)  # slots are assigned 0..n-1
+
+        snap = self._consistent(self._seq, 0, lambda: (self._values[:n].tolist(), self._stamps[:n].tolist()),
+                                self.SNAPSHOT_RETRIES)
+        if snap is None:
+            return {name: self._latest(slot) for name, slot in slots}
+
+        values, stamps = snap
+        return {name: (values[slot], stamps[slot]) for name, slot in slots}
+
+    def history(self, name):
+        self._refresh_names()
+        slot = self._slots.get(name)
+        if slot is None:
+            return [], []
+
+        H = self.history_len
+        base = slot * H
+
+        def read():
+            return (self._counts[slot], self._hist_stamps[base:base + H].tolist(),
+                    self._hist_vals[base:base + H].tolist())
+
+        count, stamps, values = self._consistent(self._seqs, slot, read)
+
+        # Rotate the ring oldest first, keep the n samples actually written
+        n = min(count, H)
+        head = count % H
+        stamps = stamps[head:] + stamps[:head]
+        values = values[head:] + values[:head]
+        return stamps[H - n:], values[H - n:]
+
+    def numpy_views(self):
+        """
+        Zero-copy views, not seqlock protected: values can change under you.
+        History rows are ring buffers, oldest sample is at counts[slot] % history_len.
+        """
+        import numpy as np
+
+        self._refresh_names()
+        S, H = self.max_signals, self.history_len
+        return {
+            "values": np.frombuffer(self._values, dtype=np.float64),
+            "stamps": np.frombuffer(self._stamps, dtype=np.float64),
+            "counts": np.frombuffer(self._counts, dtype=np.uint64),
+            "seqs": np.frombuffer(self._seqs, dtype=np.uint64),
+            "hist_vals": np.frombuffer(self._hist_vals, dtype=np.float64).reshape(S, H),
+            "hist_stamps": np.frombuffer(self._hist_stamps, dtype=np.float64).reshape(S, H),
+            "slots": dict(self._slots),
+        }
+
+    def close(self):
+        self._release()
+        self.shm.close()
+
+
+if __name__ == "__main__":
+    # Quick live view: python Signal_Bus.py [bus_name]
+    bus = SignalBusReader(sys.argv[1] if len(sys.argv) > 1 else "jvs_signals")
+
+    while True:
+        now = time.monotonic()
+        for name, (value, ts) in sorted(bus.read_latest().items()):
+            print(f"{name:>16}: {value:12.3f}  ({now - ts:6.2f}s old)")
+        print()
+        time.sleep(1)
@@ -0,0 +1,136 @@
+import ipaddress
+import json
+import socket
+import threading
+import time
+from collections import deque
+
+from LoRa_Service import id_to_name
+
+# ==============================
+# UDP re-broadcast / relay
+# ==============================
+# Ingest threads only append to a bounded deque, the relay thread does all the
+# encoding and sending in batches so other tools can see the vehicle traffic
+# without slowing the primary ingest path.
+# Raw mode does not forward command datagrams (ITV id 0x01: time sync and
+# name sync requests/responses meant for the base station) unless
+# relay_commands is set, a listener would otherwise see them as its own.
+
+COMMAND_ITV_ID = 0x01  # see TelemetryController.COMMAND_IDS
+
+
+class RelayTarget:
+    def __init__(self, name: str, addr):
+        self.name = name  # as configured
+        self.addr = addr  # resolved once, sendto never does a DNS lookup
+        self.sent = 0
+        self.dropped = 0
+        self.bytes = 0
+
+    def __str__(self):
+        return self.name
+
+
+class UdpRelay:
+    MODES = ("raw", "decoded")
+
+    def __init__(self, targets, mode="raw", max_pending=1024, batch_size=64, relay_commands=False):
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown relay mode: {mode}")
+
+        self.mode = mode
+        self.max_pending = max_pending
+        self.batch_size = batch_size
+        self.relay_commands = relay_commands
+        self.filtered = 0  # command datagrams not relayed
+        self.targets = [self._parse_target(t) for t in targets]
+
+        self.pending = deque()
+        self.wakeup = threading.Event()
+        self.running = False
+
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        if any(ipaddress.ip_address(t.addr[0]).is_multicast for t in self.targets):
+            # Stay on the local network segment
+            self.sock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_TTL, 1)
+
+    @staticmethod
+    def _parse_target(target: str) -> RelayTarget:
+        """host:port, hostnames ("localhost", "laptop.local") are resolved here, once."""
+        host, _, port = target.rpartition(":")
+        if not host or not port.isdigit():
+            raise ValueError(f"Relay target must be host:port, got {target!r}")
+        try:
+            infos = socket.getaddrinfo(host, int(port), socket.AF_INET, socket.SOCK_DGRAM)
+        except OSError as e:
+            raise ValueError(f"Relay target {target!r} does not resolve: {e}")
+        return RelayTarget(target, infos[0][4])
+
+    # ------------------------------
+    # Ingest side (must stay cheap)
+    # ------------------------------
+    def submit_raw(self, data, itv_vals):
+        """raw mode: one ITV datagram and its decoded {itv_id: value} (None if it did not decode)."""
+        if itv_vals and COMMAND_ITV_ID in itv_vals and not self.relay_commands:
+            self.filtered += 1
+            return
+        self.submit(data)
+
+    def submit(self, item):
+        """raw mode: bytes of one ITV datagram, decoded mode: {itv_id: value}"""
+        if len(self.pending) >= self.max_pending:
+            for target in self.targets:
+                target.dropped += 1
+            return
+
+        self.pending.append(item)
+        self.wakeup.set()
+
+    # ------------------------------
+    # Relay thread
+    # ------------------------------
+    def start(self):
+        self.running = True
+        threading.Thread(target=self.run, name="Relay", daemon=True).start()
+        targets = ", ".join(f"{t} ({t.addr[0]})" for t in self.targets)
+        commands = ", with commands" if self.mode == "raw" and self.relay_commands else ""
+        print(f"UDP relay ({self.mode}{commands}) -> {targets}")
+
+    def stop(self):
+        self.running = False
+        self.wakeup.set()
+
+    def run(self):
+        while self.running:
+            self.wakeup.wait(timeout=0.5)
+            self.wakeup.clear()
+
+            while self.pending:
+                batch = []
+                while self.pending and len(batch) < self.batch_size:
+                    batch.append(self._encode(self.pending.popleft()))
+                self._send_batch(batch)
+
+    def _encode(self, item) -> bytes:
+        if self.mode == "raw":
+            return item
+
+        signals = {id_to_name.get(sig_id, f"ID{sig_id}"): val for sig_id, val in item.items()}
+        return json.dumps({"ts": time.time(), "signals": signals}).encode()
+
+    def _send_batch(self, batch):
+        for target in self.targets:
+            for payload in batch:
+                try:
+                    self.sock.sendto(payload, target.addr)
+                    target.sent += 1
+                    target.bytes += len(payload)
+                except OSError:
+                    target.dropped += 1
+
+    def stats(self):
+        return [
+            {"target": str(t), "sent": t.sent, "dropped": t.dropped, "bytes": t.bytes}
+            for t in self.targets
+        ]
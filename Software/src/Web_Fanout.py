@@ -0,0 +1,194 @@
+import asyncio
+import multiprocessing as mp
+import socket
+import threading
+
+from aiohttp import web
+
+from Gui_Queue import LatestMailbox
+
+# ==============================
+# Multi-process web fan-out
+# ==============================
+# The ingest process builds + encodes each telemetry frame once and pushes the
+# bytes down a pipe to every worker. Workers share one listening socket (the
+# OS spreads new connections between them) and do all the per-client sending,
+# so viewer count no longer costs GIL time in the GUI / ingest process.
+# Each pipe is written by its own sender thread from a latest-wins slot, so a
+# stalled worker only misses frames, it never holds up the others.
+
+METRICS_PREFIX = b"#M"  # pipe message carrying /metrics text instead of a frame
+
+def fanout_worker(sock, conn, channel_meta, client_counts=None, slot=0):
+    """Entry point of a web worker process. client_counts[slot] = this worker's client count."""
+    from Device_Manager import TelemetryWebServer
+
+    server = TelemetryWebServer(None)
+    server.set_channel_meta(channel_meta)
+
+    # Ingest process metrics + this worker's own client count
+    metrics_text = [""]
+    pid = mp.current_process().pid
+    server.set_metrics_provider(
+        lambda: metrics_text[0]
+        + "# HELP jvs_worker_websocket_clients WebSocket clients connected to this worker\n"
+        + "# TYPE jvs_worker_websocket_clients gauge\n"
+        + f'jvs_worker_websocket_clients{{pid="{pid}"}} {len(server.clients)}\n'
+    )
+
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+
+    async def start_server():
+        runner = web.AppRunner(server.app)
+        await runner.setup()
+        site = web.SockSite(runner, sock)
+        await site.start()
+
+    async def pump():
+        while True:
+            try:
+                payload = await loop.run_in_executor(None, conn.recv_bytes)
+
+                # Behind? only the newest frame matters
+                while conn.poll():
+                    newer = conn.recv_bytes()
+                    if newer.startswith(METRICS_PREFIX):
+                        metrics_text[0] = newer[len(METRICS_PREFIX):].decode()
+                    else:
+                        payload = newer
+            except (EOFError, OSError):
+                # Ingest process is gone
+                break
+
+            # Read by the ingest process for jvs_websocket_clients
+            if client_counts is not None:
+                client_counts[slot] = len(server.clients)
+
+            if payload.startswith(METRICS_PREFIX):
+                metrics_text[0] = payload[len(METRICS_PREFIX):].decode()
+                continue
+
+            await server.send_to_clients(payload.decode())
+
+    loop.run_until_complete(start_server())
+    loop.run_until_complete(pump())
+
+
+class WorkerLink:
+    """
+    Pipe to one worker plus its sender thread. submit() never blocks: frames
+    and metrics text each go into a latest-wins slot, frames the worker was
+    too slow to take are counted as skipped.
+    """
+
+    def __init__(self, proc, conn, slot):
+        self.proc = proc
+        self.conn = conn
+        self.slot = slot
+        self.alive = True
+
+        self.frame = LatestMailbox()
+        self.metrics = LatestMailbox()
+        self.wakeup = threading.Event()
+        threading.Thread(target=self._run, name=f"Fanout-{slot}", daemon=True).start()
+
+    @property
+    def skipped(self):
+        return self.frame.overwritten
+
+    def submit(self, payload: bytes):
+        box = self.metrics if payload.startswith(METRICS_PREFIX) else self.frame
+        box.put(payload)
+        self.wakeup.set()
+
+    def _run(self):
+        while self.alive:
+            self.wakeup.wait()
+            self.wakeup.clear()
+            for box in (self.metrics, self.frame):
+                payload = box.take()
+                if payload is None:
+                    continue
+                try:
+                    self.conn.send_bytes(payload)
+                except (OSError, ValueError):
+                    # Broken or closed pipe: the pool reaps this link
+                    self.alive = False
+                    return
+
+    def close(self):
+        self.alive = False
+        self.wakeup.set()
+        self.conn.close()
+
+
+class WebFanoutPool:
+    def __init__(self, host, port, workers, channel_meta=None):
+        self.host = host
+        self.port = port
+        self.workers = workers
+        self.channel_meta = channel_meta or {}
+
+        self.sock = None
+        self.links = []
+        # One slot per worker, written by the worker on every frame (shared memory, no lock needed)
+        self.client_counts = mp.Array("i", workers, lock=False)
+
+    def start(self):
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.sock.bind((self.host, self.port))
+        self.sock.listen(128)
+
+        for slot in range(self.workers):
+            recv_conn, send_conn = mp.Pipe(duplex=False)
+
+            proc = mp.Process(
+                target=fanout_worker,
+                args=(self.sock, recv_conn, self.channel_meta, self.client_counts, slot),
+                daemon=True
+            )
+            proc.start()
+            recv_conn.close()
+
+            self.links.append(WorkerLink(proc, send_conn, slot))
+
+        print(f"Web fan-out: {self.workers} worker processes on port {self.port}")
+
+    def clients(self):
+        """WebSocket clients over all workers (as of their last frame)."""
+        return sum(self.client_counts)
+
+    def skipped(self):
+        """Frames replaced before a slow worker could take them."""
+        return sum(link.skipped for link in self.links)
+
+    def publish(self, payload: bytes):
+        """Hand payload to every live worker's sender thread, never blocks."""
+        dead = []
+
+        for link in self.links:
+            if link.alive and link.proc.is_alive():
+                link.submit(payload)
+            else:
+                dead.append(link)
+
+        for link in dead:
+            print(f"Web fan-out: worker {link.slot} died, dropping it")
+            self.links.remove(link)
+            link.close()
+            if link.proc.is_alive():
+                link.proc.terminate()
+            link.proc.join(timeout=0.1)
+            self.client_counts[link.slot] = 0
+
+    def stop(self):
+        for link in self.links:
+            link.close()
+        for link in self.links:
+            link.proc.join(timeout=1)
+            if link.proc.is_alive():
+                link.proc.terminate()
+        if self.sock:
+            self.sock.close()